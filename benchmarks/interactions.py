@@ -0,0 +1,65 @@
+""" Times signature verification plus decoding for the interaction payloads
+    the /interactions endpoint sees most.
+
+    Run from the repository root with `python benchmarks/interactions.py`. """
+
+import json
+import sys
+import timeit
+
+from nacl.signing import SigningKey
+
+sys.path.insert(0, "src")
+
+from dubious import pory
+from dubious.discord import api, disc
+
+user = {"id": "80351110224678912", "username": "Nelly", "discriminator": "1337", "avatar": "8342729096ea3675442027381ff50dfe"}
+
+message = {
+    "id": "1000000000000000000", "channel_id": "1100000000000000000", "author": user,
+    "content": "Query: `pokemon`", "timestamp": "2022-10-10T10:10:10.000000+00:00", "edited_timestamp": None,
+    "tts": False, "mention_everyone": False, "mentions": [], "mention_roles": [], "attachments": [],
+    "embeds": [{"title": "Query: `pokemon`", "description": "Anyone can use this query.", "footer": {"text": "Use the buttons below to add to this query."}}],
+    "pinned": False, "type": 0,
+    "components": [{"type": 1, "components": [
+        {"type": 2, "style": 2, "label": "<", "custom_id": "dexes_prev", "disabled": True},
+        {"type": 2, "style": 1, "label": "Pokemon", "custom_id": "add_pokemon"},
+        {"type": 2, "style": 1, "label": "Ability", "custom_id": "add_ability"},
+        {"type": 2, "style": 1, "label": "Move", "custom_id": "add_move"},
+        {"type": 2, "style": 2, "label": ">", "custom_id": "dexes_next"},
+    ]}],
+}
+
+base = {"id": "900000000000000001", "application_id": "900000000000000002", "token": "a" * 200, "version": 1}
+
+payloads = {
+    "ping": {**base, "type": 1},
+    "command": {
+        **base, "type": 2, "channel_id": "1100000000000000000", "guild_id": "1200000000000000000",
+        "member": {"user": user, "roles": [], "joined_at": "2022-10-10T10:10:10.000000+00:00", "deaf": False, "mute": False, "permissions": "0"},
+        "data": {"id": "900000000000000003", "name": "query", "type": 1, "options": [{"name": "query_input", "type": 3, "value": "pokemon"}]},
+    },
+    "component": {
+        **base, "type": 3, "channel_id": "1100000000000000000", "user": user, "message": message,
+        "data": {"custom_id": "add_pokemon", "component_type": 2},
+    },
+}
+
+def main():
+    signing_key = SigningKey.generate()
+    bot = pory.Pory("900000000000000002", signing_key.verify_key.encode().hex(), "")
+    timestamp = b"1670000000"
+    number = 2000
+
+    print(f"{'payload':<10} {'bytes':>6} {'verify':>10} {'decode':>10} {'total':>10}")
+    for name, payload in payloads.items():
+        body = json.dumps(payload).encode()
+        signature = signing_key.sign(timestamp + body).signature.hex()
+
+        verify = timeit.timeit(lambda: bot.verify(signature, timestamp, body), number=number) / number
+        decode = timeit.timeit(lambda: disc.cast(api.Interaction, json.loads(body)), number=number) / number
+        print(f"{name:<10} {len(body):>6} {verify * 1e6:>8.1f}us {decode * 1e6:>8.1f}us {(verify + decode) * 1e6:>8.1f}us")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+""" Measures how much memory a page of decoded messages takes, comparing the
+    slotted Disc layout with the per-instance `__dict__` layout the models
+    used before, and with lazily cast messages (not counting the raw dicts
+    they keep).
+
+    Run from the repository root with `python benchmarks/memory.py`. """
+
+import dataclasses as dc
+import json
+import sys
+import tracemalloc
+import typing as t
+
+sys.path.insert(0, "src")
+
+from dubious.discord import api, disc
+
+from interactions import message
+
+page = [{**message, "id": str(1000000000000000000 + i)} for i in range(100)]
+
+_unslotted: dict[type, type] = {}
+
+def rebuild(val: t.Any, slotted: bool) -> t.Any:
+    """ Copies a decoded value, rebuilding every Disc object either with its
+        own slotted class or with a plain class that stores its fields in an
+        instance `__dict__`. Leaf values are shared between copies so that only
+        the layout of the objects differs. """
+    if isinstance(val, list):
+        return [rebuild(item, slotted) for item in val]
+    if isinstance(val, dict):
+        return {key: rebuild(item, slotted) for key, item in val.items()}
+    if not isinstance(val, disc.Disc):
+        return val
+    cls = val.__class__
+    if not slotted:
+        cls = _unslotted.setdefault(cls, type(cls.__name__, (), {}))
+    obj = object.__new__(cls)
+    for field in dc.fields(val):
+        object.__setattr__(obj, field.name, rebuild(getattr(val, field.name), slotted))
+    return obj
+
+def measure(build: t.Callable[[], t.Any]):
+    tracemalloc.start()
+    kept = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size
+
+def main():
+    raw = json.loads(json.dumps(page))
+    decoded = disc.cast(list[api.Message], raw)
+
+    results = {
+        "dict": measure(lambda: rebuild(decoded, False)),
+        "slots": measure(lambda: rebuild(decoded, True)),
+        "lazy": measure(lambda: disc.cast(list[api.Message], raw, lazy=True)),
+    }
+    print(f"{len(page)} messages")
+    print(f"{'layout':<8} {'bytes':>10} {'per message':>12}")
+    for name, size in results.items():
+        print(f"{name:<8} {size:>10} {size // len(page):>12}")
+
+if __name__ == "__main__":
+    main()
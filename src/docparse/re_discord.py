@@ -28,7 +28,7 @@ Disc = Root.copyto(AppendNewlineParser)
 @Root.hook(r"###### (.+?) Structure")
 def create_disc_class(m: re.Match[str]):
     name, = m.groups()
-    return f"@dataclass\nclass {namify(name)}(Disc):", Disc
+    return f"@dataclass(slots=True)\nclass {namify(name)}(Disc):", Disc
 
 def unfuck_type(typ: str):
     return do_steps(typ, {
@@ -288,7 +288,7 @@ def make_http_req_nullable(m: re.Match[str]):
 @Http.hook(r"###### (Response) (?:Structure|Body)")
 def create_http_response_disc(m: re.Match[str]):
     Http.data.type_ret = f"Response_{Http.data.name}"
-    Http.data.response.append(f"@dataclass\nclass {Http.data.type_ret}(Disc):")
+    Http.data.response.append(f"@dataclass(slots=True)\nclass {Http.data.type_ret}(Disc):")
     return ""
 
 @Http.hook(r"###### (.+?) Params(.*)")
@@ -306,7 +306,7 @@ def create_http_input_disc(m: re.Match[str]):
     elif re.search(r"Query", name):
         name = f"Query{subname}"
         Http.data.type_query.append(f"{Http.data.name}.{name}")
-    Http.data.inner.append(f"    @dataclass\n    class {name}(Disc):")
+    Http.data.inner.append(f"    @dataclass(slots=True)\n    class {name}(Disc):")
     return ""
 
 @Http.hook(pat_field)
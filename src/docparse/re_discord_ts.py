@@ -289,7 +289,7 @@ def make_http_req_nullable(m: re.Match[str]):
 @Http.hook(r"###### (Response) (?:Structure|Body)")
 def create_http_response_disc(m: re.Match[str]):
     Http.data.type_ret = f"Response_{Http.data.name}"
-    Http.data.response.append(f"@dataclass\nclass {Http.data.type_ret}(Disc):")
+    Http.data.response.append(f"@dataclass(slots=True)\nclass {Http.data.type_ret}(Disc):")
     return ""
 
 @Http.hook(r"###### (.+?) Params(.*)")
@@ -307,7 +307,7 @@ def create_http_input_disc(m: re.Match[str]):
     elif re.search(r"Query", name):
         name = f"Query{subname}"
         Http.data.type_query.append(f"{Http.data.name}.{name}")
-    Http.data.inner.append(f"    @dataclass\n    class {name}(Disc):")
+    Http.data.inner.append(f"    @dataclass(slots=True)\n    class {name}(Disc):")
     return ""
 
 @Http.hook(pat_field)
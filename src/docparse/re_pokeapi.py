@@ -42,7 +42,7 @@ steps = {
         r"class NamedAPIResource(APIResource["+apitypevar_name+r"]):",
     # prepend dataclass to all classes
     r"class (.+):":
-        r"@dataclass\n"+
+        r"@dataclass(slots=True)\n"+
         r"class \1:",
     # preformat each field
     r"(\w+)\t\n\s+(.+)\n\s+(.+)":
@@ -0,0 +1,116 @@
+
+from __future__ import annotations
+
+import bisect
+import dataclasses as dc
+import threading
+from collections import OrderedDict
+
+from dubious.discord import api
+
+def _key(message: api.Message):
+    return -int(message.id)
+
+@dc.dataclass
+class ChannelMessages:
+    """ A contiguous run of a channel's most recent messages, newest first. """
+
+    messages: list[api.Message] = dc.field(default_factory=list)
+    # the newest message fetched from Discord; anything after it is fetched on refresh
+    synced: api.Snowflake | None = None
+    # whether the run reaches back to the first message in the channel
+    complete: bool = False
+
+    lock: threading.Lock = dc.field(default_factory=threading.Lock, repr=False)
+
+    def clear(self):
+        self.messages.clear()
+        self.synced = None
+        self.complete = False
+
+    def add_newer(self, newer: list[api.Message]):
+        """ Puts messages fetched after `synced`, oldest first, in front of the run. """
+        if not newer: return
+        synced = int(self.synced) if self.synced else 0
+        # sent messages newer than `synced` were fetched again with the rest
+        older = [message for message in self.messages if int(message.id) <= synced]
+        self.messages = newer[::-1] + older
+        self.synced = newer[-1].id
+
+    def add_older(self, older: list[api.Message], anchor: api.Snowflake | None):
+        """ Extends the run with messages fetched before `anchor`, newest first.
+            Returns False if the run no longer ends at `anchor`. """
+        if anchor != (self.messages[-1].id if self.messages else None):
+            return False
+        if not self.messages and older:
+            self.synced = older[0].id
+        self.messages.extend(older)
+        return True
+
+    def put(self, message: api.Message):
+        """ Replaces a message in the run, or adds it if it's newer than the
+            oldest message in the run. """
+        if not self.messages: return
+        i = bisect.bisect_left(self.messages, _key(message), key=_key)
+        if i < len(self.messages) and self.messages[i].id == message.id:
+            self.messages[i] = message
+        elif i < len(self.messages):
+            self.messages.insert(i, message)
+
+    def remove(self, message_id: api.Snowflake):
+        self.messages = [message for message in self.messages if message.id != message_id]
+
+    def trim(self, max_messages: int):
+        if len(self.messages) > max_messages:
+            del self.messages[max_messages:]
+            self.complete = False
+
+@dc.dataclass
+class MessageCache:
+    """ Keeps the recent history of the channels used most recently. """
+
+    max_channels: int = 16
+    max_messages: int = 1000
+
+    # messages served from memory and messages that had to be fetched
+    hits: int = dc.field(default=0, init=False)
+    misses: int = dc.field(default=0, init=False)
+
+    _channels: OrderedDict[api.Snowflake, ChannelMessages] = dc.field(default_factory=OrderedDict, init=False, repr=False)
+    _lock: threading.Lock = dc.field(default_factory=threading.Lock, init=False, repr=False)
+
+    def get(self, channel_id: api.Snowflake):
+        """ Returns the run for a channel, evicting the least recently used
+            channel to make room for it if it's new. """
+        channel_id = api.Snowflake(channel_id)
+        with self._lock:
+            channel = self._channels.get(channel_id)
+            if channel:
+                self._channels.move_to_end(channel_id)
+                return channel
+            channel = self._channels[channel_id] = ChannelMessages()
+            while len(self._channels) > self.max_channels:
+                self._channels.popitem(last=False)
+            return channel
+
+    def peek(self, channel_id: api.Snowflake):
+        with self._lock:
+            return self._channels.get(api.Snowflake(channel_id))
+
+    def put(self, message: api.Message):
+        channel = self.peek(message.channel_id)
+        if not channel: return
+        with channel.lock:
+            channel.put(message)
+            channel.trim(self.max_messages)
+
+    def remove(self, channel_id: api.Snowflake, message_id: api.Snowflake):
+        channel = self.peek(channel_id)
+        if not channel: return
+        with channel.lock:
+            channel.remove(message_id)
+
+    def count(self, hits: int=0, misses: int=0):
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
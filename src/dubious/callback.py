@@ -1,10 +1,14 @@
 
+import asyncio
+import atexit
 import dataclasses as dc
 import inspect
 import multiprocessing as mp
 import re
+import threading
 import traceback as tb
 import typing as t
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from dubious.discord import api
 
@@ -47,77 +51,335 @@ def prepare_option(opt: inspect.Parameter):
         choices=choices
     )
 
-ta_CommandRet = api.InteractionCallbackData | None | t.Iterator[api.InteractionCallbackData | None]
+ta_CommandRet = (
+    api.InteractionCallbackData | None |
+    t.Iterator[api.InteractionCallbackData | None] |
+    t.Awaitable[api.InteractionCallbackData | None] |
+    t.AsyncIterator[api.InteractionCallbackData | None]
+)
 
 ps_CallbackArgs = t.ParamSpec("ps_CallbackArgs")
 t_CommandRet = t.TypeVar("t_CommandRet", bound=ta_CommandRet)
 
-def do_callback(
-    callback: t.Callable[ps_CallbackArgs, t_CommandRet],
-    ixn: api.Interaction,
-    data: api.InteractionData | api.ApplicationCommandInteractionDataOption | None
-) -> t_CommandRet:
-    wants: dict[str, t.Any] = {}
+ta_Resolver = t.Callable[[api.Interaction, dict[str, t.Any]], t.Any]
+
+_missing = object()
+
+_interaction_fields = {field.name for field in dc.fields(api.Interaction)}
+_data_fields = {field.name for typ in t.get_args(api.InteractionData) for field in dc.fields(typ)}
+
+def _resolve_option(name: str, required: bool) -> ta_Resolver:
+    if required:
+        return lambda _, options: options[name]
+    return lambda _, options: options.get(name, _missing)
+
+def _resolve_user(ixn: api.Interaction, _: dict[str, t.Any]):
+    if ixn.user: return ixn.user
+    assert ixn.member
+    return ixn.member.user
+
+def bind_callback(callback: t.Callable[..., t.Any]) -> list[tuple[str, ta_Resolver]]:
+    """ Works out once where each of a callback's parameters comes from, so
+        that calling it for an interaction doesn't need to inspect it again.
+
+        Positional parameters are filled from the command's options by name.
+        Keyword-only parameters can be `ixn`, `data`, `user`, or the name of
+        any field on the interaction or on its data. """
+    binding: list[tuple[str, ta_Resolver]] = []
     for paramname, param in inspect.signature(callback).parameters.items():
         match param.kind:
             case inspect.Parameter.POSITIONAL_OR_KEYWORD:
-                assert isinstance(data, api.ApplicationCommandData)
-                if not param.default == inspect._empty: continue
-                assert data.options
-
-                found = False
-                for opt in data.options:
-                    found = opt.name == paramname
-                    if found:
-                        wants[paramname] = opt.value
-                        break
-                assert found
+                binding.append((paramname, _resolve_option(paramname, param.default == inspect._empty)))
             case inspect.Parameter.KEYWORD_ONLY:
                 if paramname == "ixn":
-                    wants[paramname] = ixn
+                    binding.append((paramname, lambda ixn, _: ixn))
                 elif paramname == "data":
-                    wants[paramname] = ixn.data
+                    binding.append((paramname, lambda ixn, _: ixn.data))
                 elif paramname == "user":
-                    if not ixn.user:
-                        assert ixn.member
-                        wants[paramname] = ixn.member.user
-                elif hasattr(ixn, paramname):
-                    wants[paramname] = getattr(ixn, paramname)
-                elif hasattr(ixn.data, paramname):
-                    wants[paramname] = getattr(ixn.data, paramname)
+                    binding.append((paramname, _resolve_user))
+                elif paramname in _interaction_fields:
+                    binding.append((paramname, lambda ixn, _, name=paramname: getattr(ixn, name)))
+                elif paramname in _data_fields:
+                    binding.append((paramname, lambda ixn, _, name=paramname: getattr(ixn.data, name)))
                 else:
-                    raise Exception()
+                    raise ValueError(f"Keyword-only parameter '{paramname}' of '{callback.__name__}' isn't a part of an interaction.")
             case _:
-                raise Exception()
+                raise ValueError(f"Parameter '{paramname}' of '{callback.__name__}' should be either positional-or-keyword or keyword-only.")
+    return binding
+
+def do_callback(
+    callback: t.Callable[ps_CallbackArgs, t_CommandRet],
+    ixn: api.Interaction,
+    data: api.InteractionData | api.ApplicationCommandInteractionDataOption | None,
+    binding: list[tuple[str, ta_Resolver]] | None = None,
+    params: dict[str, str] | None = None
+) -> t_CommandRet:
+    if binding is None: binding = bind_callback(callback)
+    options: dict[str, t.Any] = dict(params) if params else {}
+    if isinstance(data, (api.ApplicationCommandData, api.ApplicationCommandInteractionDataOption)) and data.options:
+        for opt in data.options:
+            options[opt.name] = opt.value
+
+    wants: dict[str, t.Any] = {}
+    for paramname, resolve in binding:
+        got = resolve(ixn, options)
+        if not got is _missing:
+            wants[paramname] = got
 
     return callback(**wants) # type: ignore
 
+def _drain(it: t.Iterator[t.Any]):
+    for _ in it: pass
+
+async def _drain_async(it: t.AsyncIterator[t.Any]):
+    async for _ in it: pass
+
+# follow-ups running on an event loop; referenced here so they aren't garbage collected
+_background: set[asyncio.Task] = set()
+
+def _spawn(aw: t.Awaitable[t.Any]):
+    task = asyncio.ensure_future(aw)
+    _background.add(task)
+    task.add_done_callback(_background.discard)
+
+async def wait_background():
+    """ Waits for every follow-up started by `Callback.do_async` to finish. """
+    while _background:
+        await asyncio.gather(*_background, return_exceptions=True)
+
+def _drain_on_loop(it: t.AsyncIterator[t.Any], loop: asyncio.AbstractEventLoop | None=None):
+    """ Drains an async iterator on the loop it was started on, or on a new
+        one, then closes that loop. """
+    loop = loop or asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(_drain_async(it))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
+
+def _drain_in_process(it: t.Iterator[t.Any] | t.AsyncIterator[t.Any], loop: asyncio.AbstractEventLoop | None=None):
+    # the child drains async iterators on a loop of its own
+    process = mp.Process(target=_drain_on_loop if isinstance(it, t.AsyncIterator) else _drain, args=(it,))
+    process.start()
+    process.join()
+    if loop: loop.close()
+
+@dc.dataclass
+class Worker:
+    """ Runs the rest of generator callbacks once their first response has been
+        returned to Discord.
+
+        `mode` picks where that happens: "thread" drains them on a thread pool,
+        "process" forks a process for each one (the pool's threads just wait on
+        them), and "asyncio" drains them on an event loop running in a thread of
+        its own. Outside of asyncio mode, async generators get an event loop
+        each. At most `max_workers` run at once; once `max_pending` more are
+        waiting, `submit` blocks until one finishes. """
+
+    mode: t.Literal["thread", "process", "asyncio"] = "thread"
+    max_workers: int = 8
+    max_pending: int = 64
+
+    _slots: threading.BoundedSemaphore = dc.field(init=False, repr=False)
+    _lock: threading.Lock = dc.field(default_factory=threading.Lock, init=False, repr=False)
+    _pool: ThreadPoolExecutor | None = dc.field(default=None, init=False, repr=False)
+    _loop: asyncio.AbstractEventLoop | None = dc.field(default=None, init=False, repr=False)
+    _limit: asyncio.Semaphore | None = dc.field(default=None, init=False, repr=False)
+    _running: set[Future] = dc.field(default_factory=set, init=False, repr=False)
+    _closed: bool = dc.field(default=False, init=False, repr=False)
+
+    def __post_init__(self):
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_pending)
+        atexit.register(self.shutdown)
+
+    def start(self, it: t.Iterator[t.Any] | t.AsyncIterator[t.Any]):
+        """ Returns the first item of a generator callback, then submits the
+            rest of it. """
+        if not isinstance(it, t.AsyncIterator):
+            first = next(it)
+            self.submit(it)
+            return first
+        if self.mode == "asyncio":
+            first = asyncio.run_coroutine_threadsafe(anext(it), self._get_loop()).result()
+            self.submit(it)
+            return first
+        # the rest has to run on the same loop, which finalizes the generator when it's closed
+        loop = asyncio.new_event_loop()
+        try:
+            first = loop.run_until_complete(anext(it))
+            self.submit(it, loop)
+        except BaseException:
+            loop.close()
+            raise
+        return first
+
+    def submit(self, it: t.Iterator[t.Any] | t.AsyncIterator[t.Any], loop: asyncio.AbstractEventLoop | None=None):
+        """ Drains an iterator in the background. `loop` is the event loop an
+            async iterator was started on, if it wasn't started by this Worker. """
+        if self._closed: raise RuntimeError("This Worker has been shut down.")
+
+        self._slots.acquire()
+        try:
+            if self.mode == "asyncio":
+                future = asyncio.run_coroutine_threadsafe(self._drain_async(it), self._get_loop())
+            elif self.mode == "process":
+                future = self._get_pool().submit(_drain_in_process, it, loop)
+            elif isinstance(it, t.AsyncIterator):
+                future = self._get_pool().submit(_drain_on_loop, it, loop)
+            else:
+                future = self._get_pool().submit(_drain, it)
+        except BaseException:
+            self._slots.release()
+            raise
+        self._running.add(future)
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future: Future):
+        self._running.discard(future)
+        self._slots.release()
+        if not future.cancelled() and future.exception():
+            tb.print_exception(future.exception())
+
+    def _get_pool(self):
+        with self._lock:
+            if not self._pool:
+                self._pool = ThreadPoolExecutor(self.max_workers)
+            return self._pool
+
+    def _get_loop(self):
+        with self._lock:
+            if not self._loop:
+                self._loop = asyncio.new_event_loop()
+                self._limit = asyncio.Semaphore(self.max_workers)
+                threading.Thread(target=self._loop.run_forever, daemon=True).start()
+            return self._loop
+
+    async def _drain_async(self, it: t.Iterator[t.Any] | t.AsyncIterator[t.Any]):
+        assert self._limit
+        async with self._limit:
+            if isinstance(it, t.AsyncIterator):
+                await _drain_async(it)
+            else:
+                await asyncio.to_thread(_drain, it)
+
+    def shutdown(self, wait: bool=True):
+        """ Stops taking new work. With `wait`, first finishes everything that's
+            already been submitted, so no follow-up messages get lost. """
+        if self._closed: return
+        self._closed = True
+        if wait:
+            for future in list(self._running):
+                try:
+                    future.result()
+                except Exception:
+                    pass
+        if self._pool:
+            self._pool.shutdown(wait=wait)
+        if self._loop:
+            if wait:
+                # closes the aiohttp sessions opened on this loop, among others
+                asyncio.run_coroutine_threadsafe(self._loop.shutdown_asyncgens(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+default_worker = Worker()
 
 @dc.dataclass
 class Callback(t.Generic[ps_CallbackArgs, t_CommandRet]):
     name: str
     __func__: t.Callable[ps_CallbackArgs, t_CommandRet]
+    _binding: list[tuple[str, ta_Resolver]] = dc.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._binding = bind_callback(self.__func__)
+
+    def do(self,
+        ixn: api.Interaction,
+        data: api.InteractionData | api.ApplicationCommandInteractionDataOption | None,
+        worker: Worker | None=None,
+        params: dict[str, str] | None=None
+    ) -> api.InteractionCallbackData | None:
+        """ Calls this callback for an interaction. `params` are values parsed
+            out of a templated custom_id, passed to positional parameters
+            like command options. """
+        done = do_callback(self.__func__, ixn, data, self._binding, params)
+        if inspect.isawaitable(done):
+            return asyncio.run(done)
+        if isinstance(done, (t.Iterator, t.AsyncIterator)):
+            return (worker or default_worker).start(done)
+        return done
 
-    def do(self, ixn: api.Interaction, data: api.InteractionData | api.ApplicationCommandInteractionDataOption | None) -> api.InteractionCallbackData | None:
-        done = do_callback(self.__func__, ixn, data)
+    async def do_async(self,
+        ixn: api.Interaction,
+        data: api.InteractionData | api.ApplicationCommandInteractionDataOption | None,
+        worker: Worker | None=None,
+        params: dict[str, str] | None=None
+    ) -> api.InteractionCallbackData | None:
+        """ Same as `do`, but on the running event loop. The rest of an async
+            generator callback is run as a task on the same loop, and the rest
+            of a generator callback on `worker`. Plain functions are called in
+            a thread so that they don't block the loop. """
+        if inspect.iscoroutinefunction(self.__func__) or inspect.isasyncgenfunction(self.__func__):
+            done = do_callback(self.__func__, ixn, data, self._binding, params)
+        else:
+            done = await asyncio.to_thread(do_callback, self.__func__, ixn, data, self._binding, params)
+        if inspect.isawaitable(done):
+            return await done
+        if isinstance(done, t.AsyncIterator):
+            initial_return = await anext(done)
+            _spawn(_drain_async(done))
+            return initial_return
         if isinstance(done, t.Iterator):
-            initial_return = next(done)
-            mp.Process(target=list, args=(done,)).start()
+            initial_return = await asyncio.to_thread(next, done)
+            # submitting waits for a free slot once the worker is full
+            future = await asyncio.to_thread((worker or default_worker).submit, done)
+            _spawn(asyncio.wrap_future(future))
             return initial_return
         return done
 
+pat_template_param = re.compile(r"<(\w+)>")
+
 @dc.dataclass
 class Group:
     _options: dict[str, Callback] = dc.field(default_factory=dict, kw_only=True)
+    # templated names, by the length of their literal prefix, then by that prefix
+    _templates: dict[int, dict[str, list[tuple[re.Pattern[str], Callback]]]] = dc.field(default_factory=dict, init=False, repr=False, compare=False)
 
     def __call__(self, cb: t.Callable[ps_CallbackArgs, t_CommandRet] | None = None, /, *, name: str | None=None):
+        """ Registers a callback under `name`. A name like `add_<dex>` is a
+            template: it matches any id starting with `add_`, and the rest is
+            passed to the callback's `dex` parameter. """
         def _(callback: t.Callable[ps_CallbackArgs, t_CommandRet]):
             _name = name if name else callback.__name__
-            self._options[_name] = Callback(_name, callback)
+            if pat_template_param.search(_name):
+                self.add_template(_name, Callback(_name, callback))
+            else:
+                self._options[_name] = Callback(_name, callback)
             return callback
         if cb: return _(cb)
         else: return _
 
+    def add_template(self, template: str, callback: Callback):
+        prefix = template[:template.index("<")]
+        pattern = re.compile("".join(
+            f"(?P<{part}>.+?)" if i % 2 else re.escape(part)
+                for i, part in enumerate(pat_template_param.split(template))
+        ))
+        self._templates.setdefault(len(prefix), {}).setdefault(prefix, []).append((pattern, callback))
+        # longest prefixes first, so the most specific template wins
+        self._templates = dict(sorted(self._templates.items(), reverse=True))
+
+    def route(self, name: str) -> tuple[Callback, dict[str, str]]:
+        """ Finds the callback registered for `name`, along with any values
+            parsed out of it by a template. Raises KeyError if there isn't one. """
+        callback = self._options.get(name)
+        if callback: return callback, {}
+        for length, prefixes in self._templates.items():
+            for pattern, callback in prefixes.get(name[:length], ()):
+                match = pattern.fullmatch(name)
+                if match: return callback, match.groupdict()
+        raise KeyError(name)
+
 @dc.dataclass
 class Command(api.ApplicationCommandOption, Callback[ps_CallbackArgs, t_CommandRet]):
     __func__: t.Callable[ps_CallbackArgs, t_CommandRet]
@@ -134,6 +396,7 @@ class Command(api.ApplicationCommandOption, Callback[ps_CallbackArgs, t_CommandR
         pass
 
     def __post_init__(self):
+        super().__post_init__()
         assert pat_discord_name.search(self.name), f"Command '{self.name}' has an invalid name."
         assert len(self.description) <= 100, f"The description on command '{self.name}' is too long. Should be 100 or less; got {len(self.description)}."
 
@@ -169,17 +432,42 @@ class Command(api.ApplicationCommandOption, Callback[ps_CallbackArgs, t_CommandR
     def __call__(self, *args: ps_CallbackArgs.args, **kwargs: ps_CallbackArgs.kwargs):
         return self.__func__(*args, **kwargs)
 
-    def do(self, ixn: api.Interaction, data: api.InteractionData | api.ApplicationCommandInteractionDataOption | None) -> api.InteractionCallbackData | None:
+    def do(self,
+        ixn: api.Interaction,
+        data: api.InteractionData | api.ApplicationCommandInteractionDataOption | None,
+        worker: Worker | None=None,
+        params: dict[str, str] | None=None
+    ) -> api.InteractionCallbackData | None:
+        sub = self.get_subcommand(data)
+        if sub:
+            subcommand, option = sub
+            return subcommand.do(ixn, option, worker)
+        return super().do(ixn, data, worker, params)
+
+    async def do_async(self,
+        ixn: api.Interaction,
+        data: api.InteractionData | api.ApplicationCommandInteractionDataOption | None,
+        worker: Worker | None=None,
+        params: dict[str, str] | None=None
+    ) -> api.InteractionCallbackData | None:
+        sub = self.get_subcommand(data)
+        if sub:
+            subcommand, option = sub
+            return await subcommand.do_async(ixn, option, worker)
+        return await super().do_async(ixn, data, worker, params)
+
+    def get_subcommand(self, data: api.InteractionData | api.ApplicationCommandInteractionDataOption | None):
         if (
             isinstance(data, (api.ApplicationCommandData, api.ApplicationCommandInteractionDataOption)) and
             data.options and
-            len(data.options) == 1
+            len(data.options) == 1 and
+            data.options[0].type in (api.ApplicationCommandOptionType.SUB_COMMAND, api.ApplicationCommandOptionType.SUB_COMMAND_GROUP)
         ):
             option, = data.options
             subcommand = self._options[option.name]
             assert isinstance(subcommand, Command)
-            return subcommand.do(ixn, option)
-        return super().do(ixn, data)
+            return subcommand, option
+        return None
 
 @dc.dataclass
 class CommandGroup(Group, Command[[], None]):
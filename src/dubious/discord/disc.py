@@ -2,112 +2,406 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 import dataclasses as dc
 import enum
+import json
 import math
+import os
+import re
+import threading
 import time
 import types
 import typing as t
 
-from requests import request
+from requests import Session
+from requests.adapters import HTTPAdapter
 
 
 class Snowflake(str):
-    def __init__(self, r: str|int):
-        self.id = int(r) if isinstance(r, str) else r
-        self.timestamp = (self.id >> 22) + 1420070400000
-        self.workerID = (self.id & 0x3E0000) >> 17
-        self.processID = (self.id & 0x1F000) >> 12
-        self.increment = self.id & 0xFFF
+    """ A Discord ID. Only the ID's digits are stored; the values packed into
+        it are worked out when they're asked for. """
+    __slots__ = ()
+
+    def __new__(cls, r: str|int):
+        if isinstance(r, str) and not r.isdigit():
+            raise ValueError(f"invalid snowflake: {r!r}")
+        return super().__new__(cls, r)
+
+    @property
+    def id(self):
+        return int(self)
+
+    @property
+    def timestamp(self):
+        return (int(self) >> 22) + 1420070400000
+
+    @property
+    def workerID(self):
+        return (int(self) & 0x3E0000) >> 17
+
+    @property
+    def processID(self):
+        return (int(self) & 0x1F000) >> 12
+
+    @property
+    def increment(self):
+        return int(self) & 0xFFF
 
     def __repr__(self):
-        return str(self.id)
+        return str.__str__(self)
 
     def __str__(self) -> str:
         return repr(self)
 
     def __hash__(self):
-        return self.id
+        return hash(int(self))
 
     def __eq__(self, o: object) -> bool:
         if not isinstance(o, self.__class__):
             try:
-                return int(o) == self.id # type: ignore
-            except TypeError:
+                return int(o) == int(self) # type: ignore
+            except (TypeError, ValueError):
                 return False
-        return o.id == self.id
+        return str.__eq__(self, o)
 
     def __ne__(self, o: object) -> bool:
         return not self == o
 
-@dc.dataclass
+@dc.dataclass(slots=True)
 class Disc:
     """ Root class for all Discord objects. """
 
 t_Cast = t.TypeVar("t_Cast")
-def cast(t_to: type[t_Cast], raw: t.Any, debug: t.Callable[..., None] = lambda *_, **__: None) -> t_Cast:
+ta_Decoder = t.Callable[[t.Any], t.Any]
+
+_decoders: dict[tuple[t.Any, bool], ta_Decoder] = {}
+# decoders being compiled, which are only added to `_decoders` once every
+# decoder they call is complete; only touched while holding `_compile_lock`
+_compiling: dict[tuple[t.Any, bool], ta_Decoder] = {}
+_compile_lock = threading.RLock()
+_compile_depth = 0
+
+def cast(t_to: type[t_Cast], raw: t.Any, debug: t.Callable[..., None] = lambda *_, **__: None, *, lazy: bool=False) -> t_Cast:
+    """ Converts raw JSON data into `t_to`.
+
+        With `lazy`, every Disc object keeps its raw dict and only decodes a
+        field the first time that field is accessed. """
     debug(t_to)
     debug(raw)
     if raw is None: return raw
     if dc.is_dataclass(raw): raw = dc.asdict(raw)
+    return get_decoder(t_to, lazy)(raw)
+
+def get_decoder(t_to: t.Any, lazy: bool=False) -> ta_Decoder:
+    """ Returns the decoder for `t_to`, compiling it on first use.
+
+        Decoders expect a raw value that isn't `None`; nullable values are
+        checked by whichever decoder contains them. """
+    try:
+        return _decoders[t_to, lazy]
+    except KeyError:
+        pass
+    global _compile_depth
+    with _compile_lock:
+        decoder = _decoders.get((t_to, lazy)) or _compiling.get((t_to, lazy))
+        if decoder: return decoder
+        _compile_depth += 1
+        try:
+            decoder = _compile(t_to, lazy)
+            if _compile_depth == 1: _decoders.update(_compiling)
+            return decoder
+        finally:
+            _compile_depth -= 1
+            if not _compile_depth: _compiling.clear()
 
+def _compile(t_to: t.Any, lazy: bool) -> ta_Decoder:
     t_root = t.get_origin(t_to)
 
     if t_root:
         if issubclass(t_root, list):
             t_list, *_ = t.get_args(t_to)
-            return [
-                cast(t_list, rawitem) for rawitem in raw
-            ] # type: ignore
+            decode_item = get_decoder(t_list, lazy)
+            def decode_list(raw: t.Any):
+                return [
+                    None if rawitem is None else decode_item(rawitem)
+                        for rawitem in raw
+                ]
+            _compiling[t_to, lazy] = decode_list
+            return decode_list
         elif issubclass(t_root, dict):
             t_key, t_val, *_ = t.get_args(t_to)
-            return {
-                cast(t_key, key): cast(t_val, val)
-                    for key, val in raw.items()
-            } # type: ignore
+            decode_key = get_decoder(t_key, lazy)
+            decode_val = get_decoder(t_val, lazy)
+            def decode_dict(raw: t.Any):
+                return {
+                    decode_key(key): None if val is None else decode_val(val)
+                        for key, val in raw.items()
+                }
+            _compiling[t_to, lazy] = decode_dict
+            return decode_dict
         elif issubclass(t_root, types.UnionType):
-            t_optionals = [
-                t for t in t.get_args(t_to)
-                    if t != type(None)
-            ]
-            best_score = 0
-            best_len = math.inf
-            best_opt = None
-            for t_opt in t_optionals:
-                if dc.is_dataclass(t_opt):
-                    fields = [field.name for field in dc.fields(t_opt)]
-                    score = sum(name in fields for name in raw)
-                    if (
-                        score > best_score or (
-                            score == best_score and 
-                            len(fields) < best_len
-                        )
-                    ):
-                        best_score = score
-                        best_len = len(fields)
-                        best_opt = t_opt
-                else:
-                    try:
-                        return cast(t_opt, raw)
-                    except ValueError:
-                        continue
-            return cast(best_opt, raw) #type: ignore
+            decode_union = _compile_union(t_to, lazy)
+            _compiling[t_to, lazy] = decode_union
+            return decode_union
 
     if issubclass(t_to, Disc):
-        fixedraw = {}
+        return _compile_lazy_disc(t_to) if lazy else _compile_disc(t_to)
+    else:
+        def decode_value(raw: t.Any):
+            try:
+                return t_to(raw)
+            except ValueError:
+                return raw
+        _compiling[t_to, lazy] = decode_value
+        return decode_value
 
-        fieldtypes: dict[str, type] = t.get_type_hints(t_to)
-        fixedraw = {
-            field.name: cast(
-                fieldtypes[field.name], raw[field.name] if field.name in raw else None
-            ) for field in dc.fields(t_to)
+def _compile_union(t_to: t.Any, lazy: bool) -> ta_Decoder:
+    t_optionals = [
+        t_opt for t_opt in t.get_args(t_to)
+            if t_opt != type(None)
+    ]
+    if len(t_optionals) == 1:
+        return get_decoder(t_optionals[0], lazy)
+
+    opts = [
+        (
+            t_opt,
+            frozenset(field.name for field in dc.fields(t_opt)) if dc.is_dataclass(t_opt) else None,
+            get_decoder(t_opt, lazy),
+        ) for t_opt in t_optionals
+    ]
+
+    def decode_scored(raw: t.Any):
+        best_score = 0
+        best_len = math.inf
+        best_decode = None
+        for _, fields, decode in opts:
+            if fields is not None:
+                score = sum(name in fields for name in raw)
+                if (
+                    score > best_score or (
+                        score == best_score and
+                        len(fields) < best_len
+                    )
+                ):
+                    best_score = score
+                    best_len = len(fields)
+                    best_decode = decode
+            else:
+                try:
+                    return decode(raw)
+                except ValueError:
+                    continue
+        return best_decode(raw) # type: ignore
+
+    if not all(dc.is_dataclass(t_opt) for t_opt in t_optionals):
+        return decode_scored
+
+    tag, tagged = _get_tag_table(t_optionals, lazy)
+    markers = _get_marker_table(t_optionals, lazy)
+
+    def decode_union(raw: t.Any):
+        if not isinstance(raw, dict): return raw
+        if tag:
+            decode = tagged.get(raw.get(tag))
+            if decode: return decode(raw)
+        for marker, decode in markers:
+            if marker in raw: return decode(raw)
+        return decode_scored(raw)
+    return decode_union
+
+def _get_tag_table(t_optionals: list[type], lazy: bool) -> tuple[str | None, dict[t.Any, ta_Decoder]]:
+    """ Finds a field that every member of a union defaults to a different
+        constant for, like the `type` field on message components. """
+
+    fieldsets = [{field.name: field for field in dc.fields(t_opt)} for t_opt in t_optionals]
+    for name in fieldsets[0]:
+        defaults = [
+            fields[name].default if name in fields else None
+                for fields in fieldsets
+        ]
+        if any(default is None or default is dc.MISSING for default in defaults): continue
+        if len(set(defaults)) < len(defaults): continue
+        return name, {
+            default: get_decoder(t_opt, lazy)
+                for default, t_opt in zip(defaults, t_optionals)
+        }
+    return None, {}
+
+def _get_marker_table(t_optionals: list[type], lazy: bool) -> list[tuple[str, ta_Decoder]]:
+    """ Finds, for each member of a union, a required field that no other member
+        has, like `component_type` on MessageComponentData. A payload containing
+        that field can only be that member. """
+
+    fieldsets = [dc.fields(t_opt) for t_opt in t_optionals]
+    markers: list[tuple[str, ta_Decoder]] = []
+    for t_opt, fields in zip(t_optionals, fieldsets):
+        others = {
+            field.name
+                for other in fieldsets if not other is fields
+                for field in other
         }
+        for field in fields:
+            if not (field.default is dc.MISSING and field.default_factory is dc.MISSING): continue
+            if field.name in others: continue
+            markers.append((field.name, get_decoder(t_opt, lazy)))
+            break
+    return markers
+
+def _compile_disc(t_to: type[Disc]) -> ta_Decoder:
+    decode_fields: list[tuple[str, ta_Decoder]] = []
+
+    def decode_disc(raw: t.Any):
+        if dc.is_dataclass(raw): raw = dc.asdict(raw)
+        # left as it is, like any other value that can't be cast
+        # (eg. select menu `values`, which are strings rather than SelectOptions)
+        if not isinstance(raw, dict): return raw
+        fixedraw = {}
+        for name, decode in decode_fields:
+            val = raw.get(name)
+            fixedraw[name] = None if val is None else decode(val)
         return t_to(**fixedraw)
+
+    # registered before the fields are compiled so that self-referencing types
+    # (eg. ApplicationCommandOption.options) resolve to this same decoder
+    _compiling[t_to, False] = decode_disc
+
+    try:
+        fieldtypes: dict[str, type] = t.get_type_hints(t_to)
+        for field in dc.fields(t_to):
+            decode_fields.append((field.name, get_decoder(fieldtypes[field.name])))
+    except Exception:
+        _compiling.pop((t_to, False), None)
+        raise
+    return decode_disc
+
+class _LazyField:
+    """ Decodes one field of a lazily cast Disc from its raw dict on first
+        access, then caches the result on the instance so that later accesses
+        never reach this descriptor again. """
+
+    def __init__(self, owner: type[Disc], name: str):
+        self.owner = owner
+        self.name = name
+        self.decode: ta_Decoder
+
+    def __get__(self, obj: t.Any, objtype: type | None=None):
+        if obj is None:
+            return getattr(self.owner, self.name)
+        val = obj._raw.get(self.name)
+        val = obj.__dict__[self.name] = None if val is None else self.decode(val)
+        return val
+
+def _lazy_eq(self: Disc, o: object):
+    if not isinstance(o, self.__class__.__base__):
+        return NotImplemented
+    return all(
+        getattr(self, field.name) == getattr(o, field.name)
+            for field in dc.fields(self)
+    )
+
+def _rebuild(t_to: type[Disc], fields: dict[str, t.Any]):
+    return t_to(**fields)
+
+def _lazy_reduce(self: Disc):
+    """ Pickles a lazily cast Disc as its eager type, since the lazy class
+        can't be found by name. """
+    return _rebuild, (self.__class__.__base__, {
+        field.name: getattr(self, field.name)
+            for field in dc.fields(self) if field.init
+    })
+
+def _compile_lazy_disc(t_to: type[Disc]) -> ta_Decoder:
+    lazy_fields = {field.name: _LazyField(t_to, field.name) for field in dc.fields(t_to)}
+    t_lazy: type[Disc] = type(t_to.__name__, (t_to,), {
+        **lazy_fields,
+        "__eq__": _lazy_eq,
+        "__reduce__": _lazy_reduce,
+        "__qualname__": t_to.__qualname__,
+        "__module__": t_to.__module__,
+    })
+    new = object.__new__
+
+    def decode_lazy(raw: t.Any):
+        if dc.is_dataclass(raw): raw = dc.asdict(raw)
+        if not isinstance(raw, dict): return raw
+        obj = new(t_lazy)
+        obj._raw = raw
+        return obj
+
+    _compiling[t_to, True] = decode_lazy
+
+    try:
+        fieldtypes: dict[str, type] = t.get_type_hints(t_to)
+        for name, lazy_field in lazy_fields.items():
+            lazy_field.decode = get_decoder(fieldtypes[name], True)
+    except Exception:
+        _compiling.pop((t_to, True), None)
+        raise
+    return decode_lazy
+
+ta_Encoder = t.Callable[[t.Any], t.Any]
+
+def _encode_same(val: t.Any):
+    return val
+
+def _encode_list(val: list | tuple):
+    return [encode(item) for item in val]
+
+def _encode_dict(val: dict):
+    return {str(key): encode(item) for key, item in val.items()}
+
+class Encoded(list):
+    """ A list that already holds plain JSON data, which `encode` passes
+        through as it is. """
+
+_encoders: dict[type, ta_Encoder] = {
+    str: _encode_same,
+    int: _encode_same,
+    float: _encode_same,
+    bool: _encode_same,
+    Snowflake: _encode_same,
+    list: _encode_list,
+    tuple: _encode_list,
+    dict: _encode_dict,
+    Encoded: _encode_same,
+}
+
+def encode(val: t.Any) -> t.Any:
+    """ Converts a Disc object into plain JSON data, leaving out fields that are `None`. """
+    try:
+        return _encoders[type(val)](val)
+    except KeyError:
+        return _compile_encoder(type(val))(val)
+
+def dumps(val: t.Any) -> bytes:
+    """ Serializes a Disc object into compact JSON, leaving out fields that are `None`. """
+    return json.dumps(encode(val), separators=(",", ":"), ensure_ascii=False).encode()
+
+def _compile_encoder(typ: type) -> ta_Encoder:
+    if issubclass(typ, enum.Enum):
+        # int and str enums are already understood by json
+        encode_value = _encode_same if issubclass(typ, (int, str)) else lambda val: val.value
+    elif dc.is_dataclass(typ):
+        names = tuple(field.name for field in dc.fields(typ))
+        def encode_value(val: t.Any):
+            encoded = {}
+            for name in names:
+                item = getattr(val, name)
+                if item is None: continue
+                encoded[name] = encode(item)
+            return encoded
+    elif issubclass(typ, (str, int, float)):
+        encode_value = _encode_same
+    elif issubclass(typ, (list, tuple)):
+        encode_value = _encode_list
+    elif issubclass(typ, dict):
+        encode_value = _encode_dict
     else:
-        try:
-            return t_to(raw)
-        except ValueError:
-            return raw
+        raise TypeError(f"Can't encode an object of type {typ.__name__}.")
+    _encoders[typ] = encode_value
+    return encode_value
 
 ROOT = "https://discord.com/api"
 
@@ -118,10 +412,222 @@ class Http(str, enum.Enum):
     POST = "POST"
     DELETE = "DELETE"
 
+DEFAULT_POOL_SIZE = 10
+GLOBAL_LIMIT = 50
+# how often buckets that have reset get dropped
+EVICT_INTERVAL = 60
+
+# channel, guild and webhook ids are "major parameters", which split a bucket
+# into separate limits; a webhook's token and an interaction's token do too
+pat_major = re.compile(r"^/(?:channels|guilds)/\d+|^/(?:webhooks|interactions)/\d+(?:/[^/]+)?")
+pat_id = re.compile(r"\b\d{15,}\b")
+# webhook and interaction tokens are long and new for every interaction, so
+# they're left out of routes
+pat_token = re.compile(r"^(/(?:webhooks|interactions)/\d+)/[^/]+")
+
+def get_route(method: Http, endpoint: str):
+    """ Returns the route an endpoint belongs to, which Discord assigns a
+        bucket to. Every id and token is left out, so that there's only ever
+        one route for each endpoint. """
+    endpoint = pat_token.sub(r"\1/:token", endpoint)
+    return f"{method.value} {pat_id.sub(':id', endpoint)}"
+
+def get_major(endpoint: str):
+    match = pat_major.search(endpoint)
+    return match.group() if match else ""
+
+def counts_globally(route: str):
+    """ Interaction callbacks don't count towards the global limit. """
+    return not route.startswith("POST /interactions/")
+
+@dc.dataclass
+class Bucket:
+    limit: int = 1
+    remaining: int = 1
+    reset_after: float = 0
+    reset_at: float = 0
+
+@dc.dataclass
+class RateLimits:
+    """ Tracks Discord's rate limits from response headers so that requests
+        wait for a free slot before being sent instead of after a 429. """
+
+    # keyed by the bucket's hash and the major parameter of its endpoint
+    buckets: dict[str, Bucket] = dc.field(default_factory=dict)
+    # the bucket hash of each route
+    routes: dict[str, str] = dc.field(default_factory=dict)
+
+    global_reset_at: float = 0
+    global_window: float = 0
+    global_count: int = 0
+
+    evict_at: float = 0
+
+    lock: threading.Lock = dc.field(default_factory=threading.Lock, repr=False)
+
+    def acquire(self, route: str, major: str):
+        """ Blocks until both the global limit and the bucket for `route` and
+            `major` have room, then takes a slot from each. """
+        while True:
+            wait = self.try_acquire(route, major)
+            if wait <= 0: return
+            time.sleep(wait)
+
+    async def acquire_async(self, route: str, major: str):
+        """ Same as `acquire`, but waits without blocking the event loop. """
+        while True:
+            wait = self.try_acquire(route, major)
+            if wait <= 0: return
+            await asyncio.sleep(wait)
+
+    def try_acquire(self, route: str, major: str):
+        """ Takes a slot for `route` and `major` if there is one, returning 0.
+            Otherwise returns how long to wait before trying again. """
+        with self.lock:
+            now = time.monotonic()
+            wait = self._acquire_global(route, now)
+            if wait <= 0:
+                wait = self._acquire_bucket(route, major, now)
+            return wait
+
+    def _acquire_global(self, route: str, now: float):
+        if self.global_reset_at > now:
+            return self.global_reset_at - now
+        if not counts_globally(route): return 0
+        if now - self.global_window >= 1:
+            self.global_window = now
+            self.global_count = 0
+        if self.global_count >= GLOBAL_LIMIT:
+            return self.global_window + 1 - now
+        self.global_count += 1
+        return 0
+
+    def _acquire_bucket(self, route: str, major: str, now: float):
+        bucket_hash = self.routes.get(route)
+        if not bucket_hash: return 0
+        bucket = self.buckets.get(f"{bucket_hash} {major}")
+        if not bucket: return 0
+        if bucket.reset_at <= now:
+            bucket.remaining = bucket.limit
+            bucket.reset_at = now + bucket.reset_after
+        if bucket.remaining <= 0:
+            # give back the global slot; it'll be taken again after waiting
+            if counts_globally(route): self.global_count -= 1
+            return bucket.reset_at - now
+        bucket.remaining -= 1
+        return 0
+
+    def update(self, route: str, major: str, headers: t.Mapping[str, str]):
+        bucket_hash = headers.get("X-RateLimit-Bucket")
+        if not bucket_hash: return
+        key = f"{bucket_hash} {major}"
+        with self.lock:
+            now = time.monotonic()
+            if self.evict_at <= now:
+                self._evict(now)
+            self.routes[route] = bucket_hash
+            bucket = self.buckets.setdefault(key, Bucket())
+            bucket.limit = int(headers.get("X-RateLimit-Limit", bucket.limit))
+            bucket.remaining = int(headers.get("X-RateLimit-Remaining", bucket.remaining))
+            bucket.reset_after = float(headers.get("X-RateLimit-Reset-After", bucket.reset_after))
+            bucket.reset_at = now + bucket.reset_after
+
+    def _evict(self, now: float):
+        """ Drops the buckets that have reset. A bucket that's full again
+            limits nothing until its next response, which adds it back. """
+        self.buckets = {key: bucket for key, bucket in self.buckets.items() if bucket.reset_at > now}
+        self.evict_at = now + EVICT_INTERVAL
+
+    def hit_global(self, retry_after: float):
+        with self.lock:
+            self.global_reset_at = time.monotonic() + retry_after
+
+@dc.dataclass
+class Client:
+    """ The connection pool and rate limits shared by every request made with one token. """
+
+    token: str
+    pool_size: int = DEFAULT_POOL_SIZE
+
+    pid: int = dc.field(default_factory=os.getpid, init=False)
+    session: Session = dc.field(init=False, repr=False)
+    limits: RateLimits = dc.field(default_factory=RateLimits, init=False)
+
+    # an aiohttp session for each event loop, with the async generator that closes it
+    async_sessions: dict[asyncio.AbstractEventLoop, tuple[t.Any, t.AsyncGenerator]] = dc.field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        self.session = Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size))
+        self.session.headers["Authorization"] = f"Bot {self.token}"
+
+    def get_async_session(self):
+        """ Returns an `aiohttp.ClientSession` for the running event loop,
+            opening one if needed. Requires the `async` extra. """
+        try:
+            import aiohttp
+        except ImportError as e:
+            raise ImportError("Sending requests asynchronously requires aiohttp; install dubiousdiscord[async].") from e
+        loop = asyncio.get_running_loop()
+        entry = self.async_sessions.get(loop)
+        if entry and not entry[0].closed:
+            return entry[0]
+        session = aiohttp.ClientSession(
+            headers={"Authorization": f"Bot {self.token}"},
+            connector=aiohttp.TCPConnector(limit=self.pool_size),
+        )
+        # the loop closes its async generators as it shuts down (asyncio.run
+        # does this before closing it), which closes the session with it
+        closer = self._close_with_loop(loop, session)
+        self.async_sessions[loop] = session, closer
+        loop.create_task(anext(closer)) # type: ignore
+        return session
+
+    async def _close_with_loop(self, loop: asyncio.AbstractEventLoop, session: t.Any):
+        try:
+            yield
+        finally:
+            if self.async_sessions.get(loop, (None,))[0] is session:
+                del self.async_sessions[loop]
+            await session.close()
+
+    async def aclose(self):
+        """ Closes the `aiohttp.ClientSession` for the running event loop, if
+            one was opened. """
+        entry = self.async_sessions.pop(asyncio.get_running_loop(), None)
+        if not entry: return
+        session, closer = entry
+        await closer.aclose()
+        await session.close()
+
+_clients: dict[str, Client] = {}
+
+def open_client(token: str, pool_size: int=DEFAULT_POOL_SIZE):
+    """ Creates the keep-alive session and rate limit tracker that every
+        request made with `token` goes through, replacing any that token
+        already had. """
+    old = _clients.get(token)
+    # a forked child shouldn't close sockets it shares with its parent
+    if old and old.pid == os.getpid(): old.session.close()
+    client = _clients[token] = Client(token, pool_size)
+    return client
+
+def get_client(token: str):
+    """ Returns the client for `token`, opening a new one if there isn't one
+        yet or if this process was forked from the one that opened it. """
+    client = _clients.get(token)
+    if not client:
+        return open_client(token)
+    if client.pid != os.getpid():
+        return open_client(token, client.pool_size)
+    return client
+
+_json_headers = {"Content-Type": "application/json"}
+
 t_Ret = t.TypeVar("t_Ret")
 class HttpReq(abc.ABC, t.Generic[t_Ret]):
     query: Disc | None = None
-    form: Disc | None = None
+    form: Disc | list[Disc] | None = None
 
     method: Http
     endpoint: str
@@ -131,18 +637,76 @@ class HttpReq(abc.ABC, t.Generic[t_Ret]):
         ...
 
     def do_with(self, token: str) -> t_Ret:
-        res = request(self.method, ROOT + self.endpoint,
-            headers={
-                "Authorization": f"Bot {token}"
-            },
-            params=dc.asdict(self.query) if self.query else None,
-            json=dc.asdict(self.form) if self.form else None
-        )
+        return self.cast(self.do_raw(token))
+
+    async def do_async(self, token: str) -> t_Ret:
+        return self.cast(await self.do_raw_async(token))
+
+    def get_params(self):
+        if not self.query: return None
+        return {
+            name: str(val).lower() if isinstance(val, bool) else val
+                for name, val in encode(self.query).items()
+        }
+
+    def get_body(self):
+        if self.form is None: return None
+        return dumps(self.form)
+
+    def do_raw(self, token: str) -> t.Any:
+        """ Sends this request and returns the response's JSON without casting it. """
+        client = get_client(token)
+        route = get_route(self.method, self.endpoint)
+        major = get_major(self.endpoint)
+        body = self.get_body()
+        while True:
+            client.limits.acquire(route, major)
+            res = client.session.request(self.method, ROOT + self.endpoint,
+                params=self.get_params(),
+                data=body,
+                headers=_json_headers if body is not None else None
+            )
+            client.limits.update(route, major, res.headers)
+            if res.status_code == 429:
+                error = res.json()
+                print(f"rate limited, waiting {error['retry_after']/1000} seconds")
+                if error.get("global") or res.headers.get("X-RateLimit-Global"):
+                    client.limits.hit_global(error["retry_after"]/1000)
+                elif not res.headers.get("X-RateLimit-Bucket"):
+                    time.sleep(error["retry_after"]/1000)
+                continue
+            break
         if not res.status_code in range(200, 300):
-            error = res.json()
-            if error.get("retry_after"):
+            raise Exception(f"{res.status_code}: {str(res.json())}")
+        return res.json() if res.text else None
+
+    async def do_raw_async(self, token: str) -> t.Any:
+        """ Sends this request on the running event loop and returns the
+            response's JSON without casting it. """
+        client = get_client(token)
+        session = client.get_async_session()
+        route = get_route(self.method, self.endpoint)
+        major = get_major(self.endpoint)
+        body = self.get_body()
+        while True:
+            await client.limits.acquire_async(route, major)
+            async with session.request(self.method.value, ROOT + self.endpoint,
+                params=self.get_params(),
+                data=body,
+                headers=_json_headers if body is not None else None
+            ) as res:
+                client.limits.update(route, major, res.headers)
+                status = res.status
+                text = await res.text()
+            if status == 429:
+                error = json.loads(text)
                 print(f"rate limited, waiting {error['retry_after']/1000} seconds")
-                time.sleep(error["retry_after"]/1000)
-                return self.do_with(token)
-            raise Exception(f"{res.status_code}: {str(error)}")
-        return self.cast(res.json() if res.text else None)
+                if error.get("global") or res.headers.get("X-RateLimit-Global"):
+                    client.limits.hit_global(error["retry_after"]/1000)
+                elif not res.headers.get("X-RateLimit-Bucket"):
+                    await asyncio.sleep(error["retry_after"]/1000)
+                continue
+            break
+        if not status in range(200, 300):
+            raise Exception(f"{status}: {text}")
+        return json.loads(text) if text else None
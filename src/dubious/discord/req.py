@@ -9,7 +9,7 @@ from dubious.discord.api import *
 
 @dataclass
 class GetGlobalApplicationCommands(HttpReq[list[ApplicationCommand]]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # Whether to include full localization dictionaries (`name_localizations` and `description_localizations`) in the returned objects, instead of the `name_localized` and `description_localized` fields. Default `false`.
         with_localizations: bool | None = field(kw_only=True, default=None)
@@ -27,7 +27,7 @@ class GetGlobalApplicationCommands(HttpReq[list[ApplicationCommand]]):
 
 @dataclass
 class CreateGlobalApplicationCommand(HttpReq[ApplicationCommand]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # `Name of command`, 1-32 characters                                   
         name: str | None = field(kw_only=True, default=None)
@@ -75,7 +75,7 @@ class GetGlobalApplicationCommand(HttpReq[ApplicationCommand]):
 
 @dataclass
 class EditGlobalApplicationCommand(HttpReq[ApplicationCommand]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # `Name of command`, 1-32 characters                                   
         name: str | None = field(kw_only=True, default=None)
@@ -135,7 +135,7 @@ class BulkOverwriteGlobalApplicationCommands(HttpReq[list[ApplicationCommand]]):
 
 @dataclass
 class GetGuildApplicationCommands(HttpReq[list[ApplicationCommand]]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # Whether to include full localization dictionaries (`name_localizations` and `description_localizations`) in the returned objects, instead of the `name_localized` and `description_localized` fields. Default `false`.
         with_localizations: bool | None = field(kw_only=True, default=None)
@@ -154,7 +154,7 @@ class GetGuildApplicationCommands(HttpReq[list[ApplicationCommand]]):
 
 @dataclass
 class CreateGuildApplicationCommand(HttpReq[ApplicationCommand]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # `Name of command`, 1-32 characters                                   
         name: str | None = field(kw_only=True, default=None)
@@ -202,7 +202,7 @@ class GetGuildApplicationCommand(HttpReq[ApplicationCommand]):
 
 @dataclass
 class EditGuildApplicationCommand(HttpReq[ApplicationCommand]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # `Name of command`, 1-32 characters                                   
         name: str | None = field(kw_only=True, default=None)
@@ -249,7 +249,7 @@ class DeleteGuildApplicationCommand(HttpReq[None]):
 
 @dataclass
 class BulkOverwriteGuildApplicationCommands(HttpReq[list[ApplicationCommand]]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # ID of the command, if known                                                                                                                                         
         id: Snowflake | None = field(kw_only=True, default=None)
@@ -315,7 +315,7 @@ class GetApplicationCommandPermissions(HttpReq[GuildApplicationCommandPermission
 
 @dataclass
 class EditApplicationCommandPermissions(HttpReq[None]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # Permissions for the command in the guild
         permissions: list[ApplicationCommandPermission] | None = field(kw_only=True, default=None)
@@ -351,7 +351,7 @@ class CreateInteractionResponse(HttpReq[None]):
 
 @dataclass
 class CreateStageInstance(HttpReq[StageInstance]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # The id of the Stage channel                                                                                                       
         channel_id: Snowflake | None = field(kw_only=True, default=None)
@@ -384,7 +384,7 @@ class GetStageInstance(HttpReq[None]):
 
 @dataclass
 class ModifyStageInstance(HttpReq[StageInstance]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # The topic of the Stage instance (1-120 characters)                                                           
         topic: str | None = field(kw_only=True, default=None)
@@ -444,7 +444,7 @@ class GetAutoModerationRule(HttpReq[AutoModerationRule]):
 
 @dataclass
 class CreateAutoModerationRule(HttpReq[AutoModerationRule]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # the rule name                                                                                       
         name: str | None = field(kw_only=True, default=None)
@@ -476,7 +476,7 @@ class CreateAutoModerationRule(HttpReq[AutoModerationRule]):
 
 @dataclass
 class ModifyAutoModerationRule(HttpReq[AutoModerationRule]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # the rule name                                                                                       
         name: str | None = field(kw_only=True, default=None)
@@ -534,13 +534,13 @@ class GetChannel(HttpReq[Channel]):
 
 @dataclass
 class ModifyChannel(HttpReq[Channel]):
-    @dataclass
+    @dataclass(slots=True)
     class Form_GroupDM(Disc):
         # 1-100 character channel name
         name: str | None = field(kw_only=True, default=None)
         # base64 encoded icon         
         icon: bytes | None = field(kw_only=True, default=None)
-    @dataclass
+    @dataclass(slots=True)
     class Form_GuildChannel(Disc):
         # 1-100 character channel name                                                                                                                                                      
         name: str | None = field(kw_only=True, default=None)
@@ -578,7 +578,7 @@ class ModifyChannel(HttpReq[Channel]):
         default_thread_rate_limit_per_user: int | None = field(kw_only=True, default=None)
         # the `default sort order type` used to order posts in `GUILD_FORUM` channels                                              
         default_sort_order: int | None = field(kw_only=True, default=None)
-    @dataclass
+    @dataclass(slots=True)
     class Form_Thread(Disc):
         # 1-100 character channel name                                                                                                                                                                     
         name: str | None = field(kw_only=True, default=None)
@@ -623,7 +623,7 @@ class DeleteOrCloseChannel(HttpReq[Channel]):
 
 @dataclass
 class GetChannelMessages(HttpReq[list[Message]]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # Get messages around this message ID     
         around: Snowflake | None = field(kw_only=True, default=None)
@@ -661,7 +661,7 @@ class GetChannelMessage(HttpReq[Message]):
 
 @dataclass
 class CreateMessage(HttpReq[Message]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # Message contents (up to 2000 characters)                                                                                                                                   
         content: str | None = field(kw_only=True, default=None)
@@ -759,7 +759,7 @@ class DeleteUserReaction(HttpReq[None]):
 
 @dataclass
 class GetReactions(HttpReq[list[User]]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # Get users after this user ID         
         after: Snowflake | None = field(kw_only=True, default=None)
@@ -810,7 +810,7 @@ class DeleteAllReactionsForEmoji(HttpReq[None]):
 
 @dataclass
 class EditMessage(HttpReq[Message]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # Message contents (up to 2000 characters)                                                                                               
         content: str | None = field(kw_only=True, default=None)
@@ -855,7 +855,7 @@ class DeleteMessage(HttpReq[None]):
 
 @dataclass
 class BulkDeleteMessages(HttpReq[None]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # an array of message ids to delete (2-100)
         messages: list[Snowflake] | None = field(kw_only=True, default=None)
@@ -873,7 +873,7 @@ class BulkDeleteMessages(HttpReq[None]):
 
 @dataclass
 class EditChannelPermissions(HttpReq[None]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # the bitwise value of all allowed permissions (default `"0"`)   
         allow: str | None = field(kw_only=True, default=None)
@@ -909,7 +909,7 @@ class GetChannelInvites(HttpReq[list[Invite]]):
 
 @dataclass
 class CreateChannelInvite(HttpReq[Invite]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # duration of invite in seconds before expiry, or 0 for never. between 0 and 604800 (7 days)                                               
         max_age: int | None = field(kw_only=True, default=None)
@@ -953,7 +953,7 @@ class DeleteChannelPermission(HttpReq[None]):
 
 @dataclass
 class FollowAnnouncementChannel(HttpReq[FollowedChannel]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # id of target channel
         webhook_channel_id: Snowflake | None = field(kw_only=True, default=None)
@@ -1025,7 +1025,7 @@ class UnpinMessage(HttpReq[None]):
 
 @dataclass
 class GroupDMAddRecipient(HttpReq[None]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # access token of a user that has granted your app the `gdm.join` scope
         access_token: str | None = field(kw_only=True, default=None)
@@ -1060,7 +1060,7 @@ class GroupDMRemoveRecipient(HttpReq[None]):
 
 @dataclass
 class StartThreadFromMessage(HttpReq[Channel]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # 1-100 character channel name                                                                                                              
         name: str | None = field(kw_only=True, default=None)
@@ -1083,7 +1083,7 @@ class StartThreadFromMessage(HttpReq[Channel]):
 
 @dataclass
 class StartThreadWithoutMessage(HttpReq[Channel]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # 1-100 character channel name                                                                                                              
         name: str | None = field(kw_only=True, default=None)
@@ -1109,7 +1109,7 @@ class StartThreadWithoutMessage(HttpReq[Channel]):
 
 @dataclass
 class StartThreadInForumChannel(HttpReq[Channel]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # 1-100 character channel name                                                                                       
         name: str | None = field(kw_only=True, default=None)
@@ -1214,7 +1214,7 @@ class ListThreadMembers(HttpReq[list[ThreadMember]]):
     def cast(self, data: Any):
         return cast(list[ThreadMember], data)
 
-@dataclass
+@dataclass(slots=True)
 class Response_ListPublicArchivedThreads(Disc):
     # the public, archived threads                                                                
     threads: list[Channel] | None = field(kw_only=True, default=None)
@@ -1224,7 +1224,7 @@ class Response_ListPublicArchivedThreads(Disc):
     has_more: bool | None = field(kw_only=True, default=None)
 @dataclass
 class ListPublicArchivedThreads(HttpReq[Response_ListPublicArchivedThreads]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # returns threads before this timestamp       
         before: str | None = field(kw_only=True, default=None)
@@ -1242,7 +1242,7 @@ class ListPublicArchivedThreads(HttpReq[Response_ListPublicArchivedThreads]):
     def cast(self, data: Any):
         return cast(Response_ListPublicArchivedThreads, data)
 
-@dataclass
+@dataclass(slots=True)
 class Response_ListPrivateArchivedThreads(Disc):
     # the private, archived threads                                                               
     threads: list[Channel] | None = field(kw_only=True, default=None)
@@ -1252,7 +1252,7 @@ class Response_ListPrivateArchivedThreads(Disc):
     has_more: bool | None = field(kw_only=True, default=None)
 @dataclass
 class ListPrivateArchivedThreads(HttpReq[Response_ListPrivateArchivedThreads]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # returns threads before this timestamp       
         before: str | None = field(kw_only=True, default=None)
@@ -1270,7 +1270,7 @@ class ListPrivateArchivedThreads(HttpReq[Response_ListPrivateArchivedThreads]):
     def cast(self, data: Any):
         return cast(Response_ListPrivateArchivedThreads, data)
 
-@dataclass
+@dataclass(slots=True)
 class Response_ListJoinedPrivateArchivedThreads(Disc):
     # the private, archived threads the current user has joined                                   
     threads: list[Channel] | None = field(kw_only=True, default=None)
@@ -1280,7 +1280,7 @@ class Response_ListJoinedPrivateArchivedThreads(Disc):
     has_more: bool | None = field(kw_only=True, default=None)
 @dataclass
 class ListJoinedPrivateArchivedThreads(HttpReq[Response_ListJoinedPrivateArchivedThreads]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # returns threads before this id              
         before: Snowflake | None = field(kw_only=True, default=None)
@@ -1311,7 +1311,7 @@ class GetSticker(HttpReq[Sticker]):
     def cast(self, data: Any):
         return cast(Sticker, data)
 
-@dataclass
+@dataclass(slots=True)
 class Response_ListNitroStickerPacks(Disc):
     # The list of `sticker pack`s returned
     sticker_packs: list[StickerPack] | None = field(kw_only=True, default=None)
@@ -1353,7 +1353,7 @@ class GetGuildSticker(HttpReq[Sticker]):
 
 @dataclass
 class CreateGuildSticker(HttpReq[Sticker]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # name of the sticker (2-30 characters)                                                       
         name: str | None = field(kw_only=True, default=None)
@@ -1377,7 +1377,7 @@ class CreateGuildSticker(HttpReq[Sticker]):
 
 @dataclass
 class ModifyGuildSticker(HttpReq[Sticker]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # name of the sticker (2-30 characters)                                                       
         name: str | None = field(kw_only=True, default=None)
@@ -1414,7 +1414,7 @@ class DeleteGuildSticker(HttpReq[None]):
 
 @dataclass
 class ListScheduledEventsForGuild(HttpReq[list[GuildScheduledEvent]]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # include number of users subscribed to each event
         with_user_count: bool | None = field(kw_only=True, default=None)
@@ -1432,7 +1432,7 @@ class ListScheduledEventsForGuild(HttpReq[list[GuildScheduledEvent]]):
 
 @dataclass
 class CreateGuildScheduledEvent(HttpReq[GuildScheduledEvent]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # the channel id of the scheduled event.                                                    
         channel_id: Snowflake  | None = field(kw_only=True, default=None)
@@ -1466,7 +1466,7 @@ class CreateGuildScheduledEvent(HttpReq[GuildScheduledEvent]):
 
 @dataclass
 class GetGuildScheduledEvent(HttpReq[GuildScheduledEvent]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # include number of users subscribed to this event
         with_user_count: bool | None = field(kw_only=True, default=None)
@@ -1485,7 +1485,7 @@ class GetGuildScheduledEvent(HttpReq[GuildScheduledEvent]):
 
 @dataclass
 class ModifyGuildScheduledEvent(HttpReq[GuildScheduledEvent]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # the channel id of the scheduled event, set to `null` if changing entity type to `EXTERNAL`
         channel_id: Snowflake | None = field(kw_only=True, default=None)
@@ -1536,7 +1536,7 @@ class DeleteGuildScheduledEvent(HttpReq[None]):
 
 @dataclass
 class GetGuildScheduledEventUsers(HttpReq[list[GuildScheduledEventUser]]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # number of users to return (up to maximum 100)                                 
         limit: int | None = field(kw_only=True, default=None)
@@ -1561,7 +1561,7 @@ class GetGuildScheduledEventUsers(HttpReq[list[GuildScheduledEventUser]]):
 
 @dataclass
 class CreateWebhook(HttpReq[None]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # name of the webhook (1-80 characters)
         name: str | None = field(kw_only=True, default=None)
@@ -1634,7 +1634,7 @@ class GetWebhookWithToken(HttpReq[None]):
 
 @dataclass
 class ModifyWebhook(HttpReq[Webhook]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # the default name of the webhook                   
         name: str | None = field(kw_only=True, default=None)
@@ -1697,13 +1697,13 @@ class DeleteWebhookWithToken(HttpReq[None]):
 
 @dataclass
 class ExecuteWebhook(HttpReq[None]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # waits for server confirmation of message send before response, and returns the created message body (defaults to `false`; when `false` a message that is not saved does not return an error)
         wait: bool | None = field(kw_only=True, default=None)
         # Send a message to the specified thread within a webhook's channel. The thread will automatically be unarchived.
         thread_id: Snowflake | None = field(kw_only=True, default=None)
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # the message contents (up to 2000 characters)                                                                                                                               
         content: str | None = field(kw_only=True, default=None)
@@ -1743,7 +1743,7 @@ class ExecuteWebhook(HttpReq[None]):
 
 @dataclass
 class ExecuteSlackCompatibleWebhook(HttpReq[None]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # id of the thread to send the message in                                                                                                              
         thread_id: Snowflake | None = field(kw_only=True, default=None)
@@ -1764,7 +1764,7 @@ class ExecuteSlackCompatibleWebhook(HttpReq[None]):
 
 @dataclass
 class ExecuteGitHubCompatibleWebhook(HttpReq[None]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # id of the thread to send the message in                                                                                                              
         thread_id: Snowflake | None = field(kw_only=True, default=None)
@@ -1785,7 +1785,7 @@ class ExecuteGitHubCompatibleWebhook(HttpReq[None]):
 
 @dataclass
 class GetWebhookMessage(HttpReq[Message]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # id of the thread the message is in
         thread_id: Snowflake | None = field(kw_only=True, default=None)
@@ -1805,11 +1805,11 @@ class GetWebhookMessage(HttpReq[Message]):
 
 @dataclass
 class EditWebhookMessage(HttpReq[Message]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # id of the thread the message is in
         thread_id: Snowflake | None = field(kw_only=True, default=None)
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # the message contents (up to 2000 characters)                   
         content: str | None = field(kw_only=True, default=None)
@@ -1840,7 +1840,7 @@ class EditWebhookMessage(HttpReq[Message]):
 
 @dataclass
 class DeleteWebhookMessage(HttpReq[None]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # id of the thread the message is in
         thread_id: Snowflake | None = field(kw_only=True, default=None)
@@ -1860,7 +1860,7 @@ class DeleteWebhookMessage(HttpReq[None]):
 
 @dataclass
 class GetInvite(HttpReq[Invite]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # whether the invite should contain approximate member counts
         with_counts: bool | None = field(kw_only=True, default=None)
@@ -1917,7 +1917,7 @@ class GetUser(HttpReq[User]):
 
 @dataclass
 class ModifyCurrentUser(HttpReq[User]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # user's username, if changed may cause the user's discriminator to be randomized.
         username: str | None = field(kw_only=True, default=None)
@@ -1968,7 +1968,7 @@ class LeaveGuild(HttpReq[None]):
 
 @dataclass
 class CreateDM(HttpReq[Channel]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # the recipient to open a DM channel with
         recipient_id: Snowflake | None = field(kw_only=True, default=None)
@@ -1982,7 +1982,7 @@ class CreateDM(HttpReq[Channel]):
 
 @dataclass
 class CreateGroupDM(HttpReq[Channel]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # access tokens of users that have granted your app the `gdm.join` scope
         access_tokens: list[str] | None = field(kw_only=True, default=None)
@@ -2007,7 +2007,7 @@ class GetUserConnections(HttpReq[list[Connection]]):
 
 @dataclass
 class GetGuildAuditLog(HttpReq[AuditLog]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # Entries from a specific user ID                                                                            
         user_id: Snowflake | None = field(kw_only=True, default=None)
@@ -2040,7 +2040,7 @@ class ListVoiceRegions(HttpReq[list[VoiceRegion]]):
 
 @dataclass
 class CreateGuild(HttpReq[Guild]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # name of the guild (2-100 characters)                                                                       
         name: str | None = field(kw_only=True, default=None)
@@ -2076,7 +2076,7 @@ class CreateGuild(HttpReq[Guild]):
 
 @dataclass
 class GetGuild(HttpReq[Guild]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # when `true`, will return approximate member and presence counts for the guild
         with_counts: bool | None = field(kw_only=True, default=None)
@@ -2107,7 +2107,7 @@ class GetGuildPreview(HttpReq[GuildPreview]):
 
 @dataclass
 class ModifyGuild(HttpReq[Guild]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # guild name                                                                                                                                                       
         name: str | None = field(kw_only=True, default=None)
@@ -2189,7 +2189,7 @@ class GetGuildChannels(HttpReq[list[Channel]]):
 
 @dataclass
 class CreateGuildChannel(HttpReq[Channel]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # channel name (1-100 characters)                                                                                                                                                
         name: str | None = field(kw_only=True, default=None)
@@ -2237,7 +2237,7 @@ class CreateGuildChannel(HttpReq[Channel]):
 
 @dataclass
 class ModifyGuildChannelPositions(HttpReq[None]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # channel id                                                                      
         id: Snowflake | None = field(kw_only=True, default=None)
@@ -2259,7 +2259,7 @@ class ModifyGuildChannelPositions(HttpReq[None]):
     def cast(self, data: Any):
         return None
 
-@dataclass
+@dataclass(slots=True)
 class Response_ListActiveGuildThreads(Disc):
     # the active threads                                                                          
     threads: list[Channel] | None = field(kw_only=True, default=None)
@@ -2294,7 +2294,7 @@ class GetGuildMember(HttpReq[GuildMember]):
 
 @dataclass
 class ListGuildMembers(HttpReq[list[GuildMember]]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # max number of members to return (1-1000)
         limit: int | None = field(kw_only=True, default=None)
@@ -2314,7 +2314,7 @@ class ListGuildMembers(HttpReq[list[GuildMember]]):
 
 @dataclass
 class SearchGuildMembers(HttpReq[list[GuildMember]]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # Query string to match username(s) and nickname(s) against.
         query: str | None = field(kw_only=True, default=None)
@@ -2334,7 +2334,7 @@ class SearchGuildMembers(HttpReq[list[GuildMember]]):
 
 @dataclass
 class AddGuildMember(HttpReq[GuildMember]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # an oauth2 access token granted with the `guilds.join` to the bot's application for the user you want to add to the guild
         access_token: str | None = field(kw_only=True, default=None)
@@ -2361,7 +2361,7 @@ class AddGuildMember(HttpReq[GuildMember]):
 
 @dataclass
 class ModifyGuildMember(HttpReq[GuildMember]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # value to set user's nickname to                                                                                                                                                                                                                                                                                                                  
         nick: str | None = field(kw_only=True, default=None)
@@ -2390,7 +2390,7 @@ class ModifyGuildMember(HttpReq[GuildMember]):
 
 @dataclass
 class ModifyCurrentMember(HttpReq[None]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # value to set user's nickname to
         nick: str | None = field(kw_only=True, default=None)
@@ -2408,7 +2408,7 @@ class ModifyCurrentMember(HttpReq[None]):
 
 @dataclass
 class ModifyCurrentUserNick(HttpReq[None]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # value to set user's nickname to
         nick: str | None = field(kw_only=True, default=None)
@@ -2470,7 +2470,7 @@ class RemoveGuildMember(HttpReq[None]):
 
 @dataclass
 class GetGuildBans(HttpReq[list[Ban]]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # number of users to return (up to maximum 1000)                                
         limit: int | None = field(kw_only=True, default=None)
@@ -2506,7 +2506,7 @@ class GetGuildBan(HttpReq[Ban]):
 
 @dataclass
 class CreateGuildBan(HttpReq[None]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # number of days to delete messages for (0-7) (deprecated)               
         delete_message_days: int | None = field(kw_only=True, default=None)
@@ -2554,7 +2554,7 @@ class GetGuildRoles(HttpReq[list[Role]]):
 
 @dataclass
 class CreateGuildRole(HttpReq[Role]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # name of the role                                                                                                              
         name: str | None = field(kw_only=True, default=None)
@@ -2584,7 +2584,7 @@ class CreateGuildRole(HttpReq[Role]):
 
 @dataclass
 class ModifyGuildRolePositions(HttpReq[list[Role]]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # role                        
         id: Snowflake | None = field(kw_only=True, default=None)
@@ -2604,7 +2604,7 @@ class ModifyGuildRolePositions(HttpReq[list[Role]]):
 
 @dataclass
 class ModifyGuildRole(HttpReq[Role]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # name of the role                                                                                                              
         name: str | None = field(kw_only=True, default=None)
@@ -2635,7 +2635,7 @@ class ModifyGuildRole(HttpReq[Role]):
 
 @dataclass
 class ModifyGuildMFALevel(HttpReq[int]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # `MFA level`                                                                     
         level: int | None = field(kw_only=True, default=None)
@@ -2667,7 +2667,7 @@ class DeleteGuildRole(HttpReq[None]):
 
 @dataclass
 class GetGuildPruneCount(HttpReq[Any]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # number of days to count prune for (1-30)
         days: int | None = field(kw_only=True, default=None)
@@ -2687,7 +2687,7 @@ class GetGuildPruneCount(HttpReq[Any]):
 
 @dataclass
 class BeginGuildPrune(HttpReq[Any]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # number of days to prune (1-30)                            
         days: int | None = field(kw_only=True, default=None)
@@ -2816,7 +2816,7 @@ class GetGuildVanityURL(HttpReq[Invite]):
 
 @dataclass
 class GetGuildWidgetImage(HttpReq[Any]):
-    @dataclass
+    @dataclass(slots=True)
     class Query(Disc):
         # style of the widget image returned (see below)
         style: str | None = field(kw_only=True, default=None)
@@ -2847,7 +2847,7 @@ class GetGuildWelcomeScreen(HttpReq[WelcomeScreen]):
 
 @dataclass
 class ModifyGuildWelcomeScreen(HttpReq[WelcomeScreen]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # whether the welcome screen is enabled                          
         enabled: bool | None = field(kw_only=True, default=None)
@@ -2869,7 +2869,7 @@ class ModifyGuildWelcomeScreen(HttpReq[WelcomeScreen]):
 
 @dataclass
 class ModifyCurrentUserVoiceState(HttpReq[None]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # the id of the channel the user is currently in
         channel_id: Snowflake | None = field(kw_only=True, default=None)
@@ -2891,7 +2891,7 @@ class ModifyCurrentUserVoiceState(HttpReq[None]):
 
 @dataclass
 class ModifyUserVoiceState(HttpReq[None]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # the id of the channel the user is currently in
         channel_id: Snowflake | None = field(kw_only=True, default=None)
@@ -2925,7 +2925,7 @@ class GetGuildTemplate(HttpReq[GuildTemplate]):
 
 @dataclass
 class CreateGuildFromGuildTemplate(HttpReq[Guild]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # name of the guild (2-100 characters)   
         name: str | None = field(kw_only=True, default=None)
@@ -2958,7 +2958,7 @@ class GetGuildTemplates(HttpReq[list[GuildTemplate]]):
 
 @dataclass
 class CreateGuildTemplate(HttpReq[GuildTemplate]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # name of the template (1-100 characters)        
         name: str | None = field(kw_only=True, default=None)
@@ -2992,7 +2992,7 @@ class SyncGuildTemplate(HttpReq[GuildTemplate]):
 
 @dataclass
 class ModifyGuildTemplate(HttpReq[GuildTemplate]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # name of the template (1-100 characters)        
         name: str | None = field(kw_only=True, default=None)
@@ -3054,7 +3054,7 @@ class GetGuildEmoji(HttpReq[Emoji]):
 
 @dataclass
 class CreateGuildEmoji(HttpReq[Emoji]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # name of the emoji                             
         name: str | None = field(kw_only=True, default=None)
@@ -3076,7 +3076,7 @@ class CreateGuildEmoji(HttpReq[Emoji]):
 
 @dataclass
 class ModifyGuildEmoji(HttpReq[Emoji]):
-    @dataclass
+    @dataclass(slots=True)
     class Form(Disc):
         # name of the emoji                            
         name: str | None = field(kw_only=True, default=None)
@@ -3118,7 +3118,7 @@ class GetCurrentBotApplicationInformation(HttpReq[Application]):
     def cast(self, data: Any):
         return cast(Application, data)
 
-@dataclass
+@dataclass(slots=True)
 class Response_GetCurrentAuthorizationInformation(Disc):
     # the current application                                                          
     application: Application | None = field(kw_only=True, default=None)
@@ -2,15 +2,18 @@
 from __future__ import annotations
 
 import dataclasses as dc
+import hashlib
 import json
 import multiprocessing as mp
+import os
 import typing as t
-from pprint import pprint
+from concurrent.futures import ThreadPoolExecutor
 
-from flask import Flask, abort, jsonify, request
+from flask import Flask, Response, abort, request
 from nacl.exceptions import BadSignatureError
 from nacl.signing import VerifyKey
 
+from dubious import cache as ch
 from dubious import callback as cb
 from dubious.discord import api, disc, req
 
@@ -34,16 +37,45 @@ def _match_response_type(response: api.InteractionCallbackData | None, ixn_type:
         case _:
             raise Exception()
 
+# Discord pings the endpoint to check that it's up; these never reach a callback
+_pong = disc.dumps(api.InteractionResponse(api.InteractionCallbackType.PONG))
+
+def _hash_commands(commands: t.Iterable[cb.Command]):
+    payloads = sorted(
+        json.dumps(dc.asdict(disc.cast(req.CreateGlobalApplicationCommand.Form, command)), sort_keys=True)
+            for command in commands
+    )
+    return hashlib.sha256("\n".join(payloads).encode()).hexdigest()
+
 @dc.dataclass
 class Pory:
     app_id: dc.InitVar[str]
     public_key: str
     token: str
 
+    pool_size: int = dc.field(default=disc.DEFAULT_POOL_SIZE, kw_only=True)
+    # where to remember the commands from the last successful sync; when set,
+    # scopes whose commands haven't changed since then aren't synced again
+    manifest_path: str | None = dc.field(default=None, kw_only=True)
+    # runs the rest of generator callbacks after their first response
+    worker: cb.Worker = dc.field(default_factory=lambda: cb.default_worker, kw_only=True)
+    # recent messages per channel, for `history` to serve from memory. Edits
+    # and deletions made by anyone else aren't seen until a channel is evicted
+    cache: ch.MessageCache | None = dc.field(default=None, kw_only=True)
+
     id: disc.Snowflake = dc.field(init=False)
+    command_groups: dict[int, cb.CommandGroup] = dc.field(init=False, repr=False)
+    verify_key: VerifyKey = dc.field(init=False, repr=False)
 
     def __post_init__(self, app_id: str):
         self.id = disc.Snowflake(app_id)
+        self.verify_key = VerifyKey(bytes.fromhex(self.public_key))
+        disc.open_client(self.token, self.pool_size)
+        self.command_groups = {
+            api.ApplicationCommandType.CHAT_INPUT: self.on_command,
+            api.ApplicationCommandType.MESSAGE: self.on_message,
+            api.ApplicationCommandType.USER: self.on_user,
+        }
 
     on_command: cb.CommandGroup = dc.field(default_factory=cb.CommandGroup.new, init=False)
     on_message: cb.CommandGroup = dc.field(default_factory=cb.CommandGroup.new, init=False)
@@ -55,132 +87,236 @@ class Pory:
         app = Flask(__name__)
         
         self.sync_commands()
-        verify_key = VerifyKey(bytes.fromhex(self.public_key))
 
         @app.route("/interactions", methods=["POST"])
         def _():
-            signature = request.headers["X-Signature-Ed25519"]
-            timestamp = request.headers["X-Signature-Timestamp"]
-            body = request.data.decode("utf-8")
-
-            try:
-                verify_key.verify(f"{timestamp}{body}".encode(), bytes.fromhex(signature))
-            except BadSignatureError:
+            body = request.get_data()
+            if not self.verify(
+                request.headers.get("X-Signature-Ed25519"),
+                request.headers.get("X-Signature-Timestamp"),
+                body
+            ):
                 abort(401, "Invalid request signature")
 
-            if not request.json:
+            ixn_json = json.loads(body) if body else None
+            if not ixn_json:
                 return abort(405, "Bad request")
-            ixn_json = request.json
+            if ixn_json.get("type") == api.InteractionType.PING:
+                return Response(_pong, mimetype="application/json")
             ixn = disc.cast(api.Interaction, ixn_json)
             res = self.handle(ixn)
-            return jsonify(dc.asdict(res))
+            return Response(disc.dumps(res), mimetype="application/json")
 
         return app
 
-    def sync_commands(self):
-        prepared_on_command = self.on_command.get_commands(as_type=api.ApplicationCommandType.CHAT_INPUT)
-        prepared_on_message = self.on_message.get_commands(as_type=api.ApplicationCommandType.MESSAGE)
-        prepared_on_user = self.on_user.get_commands(as_type=api.ApplicationCommandType.USER)
-
-        registered_commands: list[api.ApplicationCommand] = []
-        guilds = req.GetCurrentUserGuilds().do_with(self.token)
-        for guild in guilds:
-            registered_commands += req.GetGuildApplicationCommands(self.id, guild.id).do_with(self.token)
-        registered_commands += req.GetGlobalApplicationCommands(self.id).do_with(self.token)
-
-        for registered in registered_commands:
-            match registered.type:
-                case api.ApplicationCommandType.CHAT_INPUT:
-                    prepared = prepared_on_command
-                case api.ApplicationCommandType.MESSAGE:
-                    prepared = prepared_on_message
-                case api.ApplicationCommandType.USER:
-                    prepared = prepared_on_user
-                case _:
-                    raise Exception()
-            self.compare_if_exists(registered, prepared)
+    def asgi(self):
+        """ Returns an ASGI app serving the same `/interactions` endpoint as
+            `flask`, for running with an ASGI server like uvicorn. Callbacks can
+            be coroutines or async generators. Anything after an async
+            generator's first response runs on the server's event loop, and
+            anything after a generator's first response runs on `worker`. """
+        self.sync_commands()
 
-        for to_register in (
-            list(prepared_on_command.values()) +
-            list(prepared_on_message.values()) +
-            list(prepared_on_user.values())
-        ):
-            self.create_command(to_register)
+        async def respond(send: t.Callable[[dict], t.Awaitable[None]], status: int, body: bytes, content_type: bytes=b"text/plain"):
+            await send({
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-type", content_type), (b"content-length", str(len(body)).encode())],
+            })
+            await send({"type": "http.response.body", "body": body})
+
+        async def app(scope: dict, receive: t.Callable[[], t.Awaitable[dict]], send: t.Callable[[dict], t.Awaitable[None]]):
+            if scope["type"] == "lifespan":
+                while True:
+                    message = await receive()
+                    if message["type"] == "lifespan.startup":
+                        await send({"type": "lifespan.startup.complete"})
+                    elif message["type"] == "lifespan.shutdown":
+                        await cb.wait_background()
+                        await disc.get_client(self.token).aclose()
+                        await send({"type": "lifespan.shutdown.complete"})
+                        return
+            if not scope["type"] == "http": return
+            if not scope["path"] == "/interactions":
+                return await respond(send, 404, b"Not found")
+            if not scope["method"] == "POST":
+                return await respond(send, 405, b"Method not allowed")
+
+            body = b""
+            while True:
+                message = await receive()
+                body += message.get("body", b"")
+                if not message.get("more_body"): break
+
+            headers = dict(scope["headers"])
+            if not self.verify(
+                headers.get(b"x-signature-ed25519"),
+                headers.get(b"x-signature-timestamp"),
+                body
+            ):
+                return await respond(send, 401, b"Invalid request signature")
 
-    def compare_if_exists(self, registered: api.ApplicationCommand, prepared: dict[str, cb.Command]):
-        if not registered.name in prepared:
-            if not registered.guild_id:
-                print(f"Deleting registered command: {registered.name}")
-                req.DeleteGlobalApplicationCommand(self.id, registered.id).do_with(self.token)
+            ixn_json = json.loads(body) if body else None
+            if not ixn_json:
+                return await respond(send, 400, b"Bad request")
+            if ixn_json.get("type") == api.InteractionType.PING:
+                return await respond(send, 200, _pong, b"application/json")
+            ixn = disc.cast(api.Interaction, ixn_json)
+            res = await self.handle_async(ixn)
+            await respond(send, 200, disc.dumps(res), b"application/json")
+
+        return app
+
+    def verify(self, signature: str | bytes | None, timestamp: str | bytes | None, body: bytes):
+        """ Checks Discord's signature on the raw body of an interaction request. """
+        if not (signature and timestamp): return False
+        if isinstance(signature, bytes): signature = signature.decode()
+        if isinstance(timestamp, str): timestamp = timestamp.encode()
+        try:
+            self.verify_key.verify(timestamp + body, bytes.fromhex(signature))
+        except (BadSignatureError, ValueError):
+            return False
+        return True
+
+    def sync_commands(self):
+        """ Brings the commands registered with Discord in line with the ones
+            defined on this bot, with one bulk overwrite for each scope (global
+            or a guild) that differs. """
+        prepared: dict[api.Snowflake | None, dict[tuple[int, str], cb.Command]] = {None: {}}
+        for group, as_type in (
+            (self.on_command, api.ApplicationCommandType.CHAT_INPUT),
+            (self.on_message, api.ApplicationCommandType.MESSAGE),
+            (self.on_user, api.ApplicationCommandType.USER),
+        ):
+            for command in group.get_commands(as_type=as_type).values():
+                guild_id = disc.Snowflake(command.guild_id) if command.guild_id else None
+                prepared.setdefault(guild_id, {})[as_type, command.name] = command
+
+        hashes = {
+            self.get_scope_key(guild_id): _hash_commands(commands.values())
+                for guild_id, commands in prepared.items() if commands
+        }
+        synced = self.load_manifest()
+
+        with ThreadPoolExecutor(self.pool_size) as pool:
+            if synced is None:
+                # guilds without any prepared commands may still have stale ones to delete
+                for guild in req.GetCurrentUserGuilds().do_with(self.token):
+                    prepared.setdefault(guild.id, {})
+                scopes = list(prepared)
             else:
-                print(f"Deleting registered command in guild {registered.guild_id}: {registered.name}")
-                req.DeleteGuildApplicationCommand(self.id, registered.guild_id, registered.id).do_with(self.token)
-        elif registered.guild_id == prepared[registered.name].guild_id:
-            if not prepared[registered.name].compare_with(registered):
-                pprint(prepared[registered.name].options)
-                pprint(registered.options)
-                if not registered.guild_id:
-                    print(f"Updating registered command: {registered.name}")
-                    req.EditGlobalApplicationCommand(self.id, registered.id, disc.cast(req.EditGlobalApplicationCommand.Form, registered))
-                else:
-                    print(f"Updating registered command in guild {registered.guild_id}: {registered.name}")
-                    req.EditGuildApplicationCommand(self.id, registered.guild_id, registered.id, disc.cast(req.EditGuildApplicationCommand.Form, registered))
-            prepared.pop(registered.name)
-
-    def create_command(self, to_register: cb.Command):
-        if not to_register.guild_id:
-            print(f"Creating new command: {to_register.name}")
-            req.CreateGlobalApplicationCommand(self.id, form=disc.cast(req.CreateGlobalApplicationCommand.Form, to_register)).do_with(self.token)
+                scopes = [
+                    disc.Snowflake(key) if key != "global" else None
+                        for key in set(hashes) | set(synced)
+                            if hashes.get(key) != synced.get(key)
+                ]
+                for guild_id in scopes:
+                    prepared.setdefault(guild_id, {})
+            registered = pool.map(self.get_registered_commands, scopes)
+            changed = [
+                guild_id for guild_id, registered_commands in zip(scopes, registered)
+                    if not self.compare_commands(registered_commands, prepared[guild_id])
+            ]
+            list(pool.map(lambda guild_id: self.overwrite_commands(guild_id, list(prepared[guild_id].values())), changed))
+
+        self.save_manifest(hashes)
+
+    def get_scope_key(self, guild_id: api.Snowflake | None):
+        return str(guild_id) if guild_id else "global"
+
+    def load_manifest(self) -> dict[str, str] | None:
+        if not self.manifest_path or not os.path.exists(self.manifest_path): return None
+        with open(self.manifest_path, "r") as f:
+            manifest = json.load(f)
+        if manifest.get("app_id") != str(self.id): return None
+        return manifest["scopes"]
+
+    def save_manifest(self, hashes: dict[str, str]):
+        if not self.manifest_path: return
+        with open(f"{self.manifest_path}.tmp", "w") as f:
+            json.dump({"app_id": str(self.id), "scopes": hashes}, f, indent=4)
+        os.replace(f"{self.manifest_path}.tmp", self.manifest_path)
+
+    def get_registered_commands(self, guild_id: api.Snowflake | None):
+        if not guild_id:
+            return req.GetGlobalApplicationCommands(self.id).do_with(self.token)
+        return req.GetGuildApplicationCommands(self.id, guild_id).do_with(self.token)
+
+    def compare_commands(self, registered: list[api.ApplicationCommand], prepared: dict[tuple[int, str], cb.Command]):
+        if len(registered) != len(prepared): return False
+        for command in registered:
+            key = (command.type or api.ApplicationCommandType.CHAT_INPUT, command.name)
+            if not key in prepared: return False
+            if not prepared[key].compare_with(command): return False
+        return True
+
+    def overwrite_commands(self, guild_id: api.Snowflake | None, commands: list[cb.Command]):
+        names = ", ".join(command.name for command in commands) or "(none)"
+        if not guild_id:
+            print(f"Overwriting registered commands: {names}")
+            request = req.BulkOverwriteGlobalApplicationCommands(self.id)
+            form = req.CreateGlobalApplicationCommand.Form
         else:
-            print(f"Creating new command in guild {to_register.guild_id}: {to_register.name}")
-            req.CreateGuildApplicationCommand(self.id, to_register.guild_id, form=disc.cast(req.CreateGuildApplicationCommand.Form, to_register)).do_with(self.token)
+            print(f"Overwriting registered commands in guild {guild_id}: {names}")
+            request = req.BulkOverwriteGuildApplicationCommands(self.id, guild_id)
+            form = req.BulkOverwriteGuildApplicationCommands.Form
+        # the bulk overwrite endpoints take a list of commands, which the
+        # generated requests only describe one of
+        request.form = [disc.cast(form, command) for command in commands] # type: ignore
+        request.do_with(self.token)
 
     def handle(self, ixn: api.Interaction):
+        callback, params, data = self.route(ixn)
+        response = callback.do(ixn, data, self.worker, params) if isinstance(callback, cb.Callback) else None
+        return api.InteractionResponse(_match_response_type(response, ixn.type), data=response)
+
+    async def handle_async(self, ixn: api.Interaction):
+        callback, params, data = self.route(ixn)
+        response = await callback.do_async(ixn, data, self.worker, params) if isinstance(callback, cb.Callback) else None
+        return api.InteractionResponse(_match_response_type(response, ixn.type), data=response)
+
+    def route(self, ixn: api.Interaction):
         match ixn:
             case api.Interaction(
-                type=api.InteractionType.PING as ixn_type,
+                type=api.InteractionType.PING,
                 data=None as data
             ):
-                callback = self.get_callback_for_ping()
+                callback, params = self.get_callback_for_ping()
 
             case api.Interaction(
-                type=api.InteractionType.APPLICATION_COMMAND as ixn_type,
-                data=api.ApplicationCommandData(name=command_name) as data
+                type=api.InteractionType.APPLICATION_COMMAND,
+                data=api.ApplicationCommandData(name=command_name, type=command_type) as data
             ):
-                callback = self.get_callback_for_command(command_name)
+                callback, params = self.get_callback_for_command(command_name, command_type)
 
             case api.Interaction(
-                type=api.InteractionType.MODAL_SUBMIT as ixn_type,
+                type=api.InteractionType.MODAL_SUBMIT,
                 data=api.ModalSubmitData(custom_id=modal_id) as data
             ):
-                callback = self.get_callback_for_modal(modal_id)
+                callback, params = self.get_callback_for_modal(modal_id)
 
             case api.Interaction(
-                type=api.InteractionType.MESSAGE_COMPONENT as ixn_type,
+                type=api.InteractionType.MESSAGE_COMPONENT,
                 data=api.MessageComponentData(custom_id=component_id) as data
             ):
-                callback = self.get_callback_for_component(component_id)
+                callback, params = self.get_callback_for_component(component_id)
 
             case _:
                 raise Exception()
 
-        response = callback.do(ixn, data) if isinstance(callback, cb.Callback) else None
-        return api.InteractionResponse(_match_response_type(response, ixn_type), data=response)
+        return callback, params, data
     
-    def get_callback_for_ping(self):
-        return None
+    def get_callback_for_ping(self) -> tuple[cb.Callback | None, dict[str, str]]:
+        return None, {}
     
-    def get_callback_for_command(self, command_name: str):
-        return next(filter(
-            lambda on: command_name in on._options,
-            (self.on_command, self.on_message, self.on_user)
-        ))._options[command_name]
+    def get_callback_for_command(self, command_name: str, command_type: int=api.ApplicationCommandType.CHAT_INPUT) -> tuple[cb.Callback | None, dict[str, str]]:
+        return self.command_groups[command_type]._options[command_name], {}
     
-    def get_callback_for_modal(self, modal_id: str):
-        return self.on_modal._options[modal_id]
+    def get_callback_for_modal(self, modal_id: str) -> tuple[cb.Callback | None, dict[str, str]]:
+        return self.on_modal.route(modal_id)
     
-    def get_callback_for_component(self, component_id: str):
-        return self.on_component._options[component_id]
+    def get_callback_for_component(self, component_id: str) -> tuple[cb.Callback | None, dict[str, str]]:
+        return self.on_component.route(component_id)
 
     def create_cancel_button(self, ixn_id: api.Snowflake, token: str, process_message: str, button_text: str):
         lock = mp.Event()
@@ -213,31 +349,139 @@ class Pory:
         req.DeleteWebhookMessage(self.id, token, response_id).do_with(self.token)
     
     def send(self, channel_id: api.Snowflake, message: req.CreateMessage.Form):
-        return req.CreateMessage(channel_id, message).do_with(self.token)
+        sent = req.CreateMessage(channel_id, message).do_with(self.token)
+        if self.cache: self.cache.put(sent)
+        return sent
     
     def edit(self, channel_id: api.Snowflake, message_id: api.Snowflake, message: req.EditMessage.Form):
-        return req.EditMessage(channel_id, message_id, message).do_with(self.token)
+        edited = req.EditMessage(channel_id, message_id, message).do_with(self.token)
+        if self.cache: self.cache.put(edited)
+        return edited
     
     def delete(self, channel_id: api.Snowflake, message_id: api.Snowflake):
         req.DeleteMessage(channel_id, message_id).do_with(self.token)
-
-    def history(self, channel_id: api.Snowflake, limit: int=200, chunk_size: int=50):
-        message: api.Message | None = None
-        while limit:
-            chunk = limit
-            if chunk > chunk_size:
-                chunk = chunk_size
-            messages = req.GetChannelMessages(channel_id, req.GetChannelMessages.Query(
-                before = message.id if message else None,
+        if self.cache: self.cache.remove(channel_id, message_id)
+
+    def history(self,
+        channel_id: api.Snowflake,
+        limit: int=200,
+        chunk_size: int=100,
+        *,
+        before: api.Snowflake | None=None,
+        after: api.Snowflake | None=None,
+        around: api.Snowflake | None=None,
+        lazy: bool=False
+    ):
+        """ Yields messages from a channel, newest first, or oldest first when
+            paging forward from `after`. `around` yields the single page of
+            messages surrounding that message.
+
+            With a `cache` and no cursor, recent messages come from the cache after
+            fetching whatever was posted since it was last refreshed, and
+            older messages that had to be fetched are added to it.
+
+            With `lazy`, each message only decodes the fields that are read from it. """
+        if len([cursor for cursor in (before, after, around) if cursor]) > 1:
+            raise ValueError("Only one of `before`, `after` or `around` can be given.")
+        if self.cache and not (before or after or around):
+            yield from self.cached_history(self.cache, channel_id, limit, chunk_size, lazy)
+            return
+        for page in self.history_pages(channel_id, limit, chunk_size, before=before, after=after, around=around, lazy=lazy):
+            yield from page
+
+    def cached_history(self, cache: ch.MessageCache, channel_id: api.Snowflake, limit: int, chunk_size: int, lazy: bool):
+        channel = cache.get(channel_id)
+        self.refresh_channel(cache, channel, channel_id, chunk_size, lazy)
+        with channel.lock:
+            cached = channel.messages[:limit]
+            complete = channel.complete and len(cached) == len(channel.messages)
+
+        for message in cached:
+            cache.count(hits=1)
+            yield message
+        limit -= len(cached)
+        if limit <= 0 or complete: return
+
+        chunk_size = min(chunk_size, 100)
+        anchor = cached[-1].id if cached else None
+        extending = True
+        for page in self.history_pages(channel_id, limit, chunk_size, before=anchor, lazy=lazy):
+            cache.count(misses=len(page))
+            requested = min(limit, chunk_size)
+            limit -= len(page)
+            # stops extending the run once another reader has changed where it ends
+            if extending:
+                with channel.lock:
+                    extending = channel.add_older(page, anchor)
+                    if extending:
+                        if len(page) < requested:
+                            channel.complete = True
+                        channel.trim(cache.max_messages)
+                        if page: anchor = page[-1].id
+            yield from page
+
+    def refresh_channel(self, cache: ch.MessageCache, channel: ch.ChannelMessages, channel_id: api.Snowflake, chunk_size: int, lazy: bool):
+        """ Fetches the messages posted in a channel since it was last synced.
+            The channel isn't locked while fetching, so if another reader
+            refreshed it in the meantime, what was fetched is left out. """
+        with channel.lock:
+            synced = channel.synced
+        if not synced: return
+        newer: list[api.Message] = []
+        for page in self.history_pages(channel_id, cache.max_messages, chunk_size, after=synced, lazy=lazy):
+            newer.extend(page)
+        cache.count(misses=len(newer))
+        with channel.lock:
+            if channel.synced != synced: return
+            if len(newer) >= cache.max_messages:
+                # too much was missed for the run to be worth keeping
+                channel.clear()
+            else:
+                channel.add_newer(newer)
+                channel.trim(cache.max_messages)
+
+    def history_pages(self,
+        channel_id: api.Snowflake,
+        limit: int=200,
+        chunk_size: int=100,
+        *,
+        before: api.Snowflake | None=None,
+        after: api.Snowflake | None=None,
+        around: api.Snowflake | None=None,
+        lazy: bool=False
+    ):
+        """ Yields pages of messages from a channel, in the order `history` yields them.
+
+            The next page is fetched in the background while the current one
+            is consumed; nothing more is fetched once the iterator is closed. """
+        chunk_size = min(chunk_size, 100)
+
+        def fetch(cursor: api.Snowflake | None, chunk: int) -> list[t.Any]:
+            return req.GetChannelMessages(channel_id, req.GetChannelMessages.Query(
+                before = cursor if not (after or around) else None,
+                after = cursor if after else None,
+                around = cursor if around else None,
                 limit = chunk
-            )).do_with(self.token)
-            while messages:
-                message = messages.pop(0)
-                yield message
-                limit -= 1
-                chunk -= 1
-            if chunk:
-                limit = 0
+            )).do_raw(self.token)
+
+        pool = ThreadPoolExecutor(1)
+        try:
+            chunk = min(limit, chunk_size)
+            pending = pool.submit(fetch, after or around or before, chunk) if chunk > 0 else None
+            while pending:
+                raw: list[t.Any] = pending.result()
+                limit -= len(raw)
+                # pages always come newest first
+                if after: raw.reverse()
+
+                pending = None
+                if not around and len(raw) == chunk and limit > 0:
+                    chunk = min(limit, chunk_size)
+                    pending = pool.submit(fetch, api.Snowflake(raw[-1]["id"]), chunk)
+
+                yield disc.cast(list[api.Message], raw, lazy=lazy)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
 t_ConfigType = t.TypeVar("t_ConfigType")
 @dc.dataclass
@@ -3,11 +3,17 @@ from pprint import pprint
 import re
 import datetime as dt
 import dataclasses as dc
+import functools
+import json
+import os
+import threading
+import time
 import typing as t
 
 import dubious.pory as pory
+import dubious.cache as cache
 import dubious.callback as cb
-from dubious.discord import api, req
+from dubious.discord import api, disc, req
 
 from pokeapi import api as pkapi, zyg
 
@@ -94,14 +100,15 @@ class Query:
     def can_dec_dex(self):
         return self.dex_index > 0
     def dec_dex(self):
-        if self.can_dec_dex:
+        if self.can_dec_dex():
             self.dex_index -= 1
     
     def collect(self):
-        return {
-            "embeds": [self.header_embed()],
-            "components": self.parse()
-        }
+        return render_query(
+            tuple(self.tokens),
+            frozenset(self.allowed_users) if self.allowed_users is not True else True,
+            self.dex_index,
+        )
 
     def header_embed(self):
         return api.Embed(
@@ -135,59 +142,216 @@ class Query:
             api.Button(api.ButtonStyle.SECONDARY, label=dexes_prev_label, custom_id=dexes_prev, disabled=not self.can_dec_dex()),
             *[
                 api.Button(api.ButtonStyle.PRIMARY, label=dexname.replace("_", " ").title(), custom_id=f"{add}{dexname}")
-                    for dexname in list(zyg.dexes.keys())[self.dex_index:self.dex_index+3]
+                    for dexname in get_dex_names()[self.dex_index:self.dex_index+3]
             ],
             api.Button(api.ButtonStyle.SECONDARY, label=dexes_next_label, custom_id=dexes_next, disabled=not self.can_inc_dex()),
         ])
 
+@functools.cache
+def get_dex_names():
+    return tuple(zyg.dexes)
+
+@functools.lru_cache(maxsize=1024)
+def render_query(tokens: tuple[str, ...], allowed_users: frozenset[api.Snowflake] | t.Literal[True], dex_index: int):
+    """ Returns the embeds and components showing a query, already encoded.
+        The result is shared between calls, so it mustn't be changed. """
+    q = Query(list(tokens), dt.datetime.min, set(allowed_users) if allowed_users is not True else True, dex_index)
+    return {
+        "embeds": disc.Encoded([disc.encode(q.header_embed())]),
+        "components": disc.Encoded(disc.encode(q.parse())),
+    }
+
+def edited_at(message: api.Message):
+    """ Returns when a message was last changed, as a POSIX timestamp. """
+    return dt.datetime.fromisoformat(message.edited_timestamp or message.timestamp).timestamp()
+
+@dc.dataclass
+class QueryStore:
+    """ Keeps the queries that were recently shown, so that a button press
+        doesn't have to parse its query back out of the message. """
+    # seconds a query is kept after it was last shown
+    ttl: float = 15 * 60
+    # each query, when it expires, and when the message showing it was last changed
+    queries: dict[tuple[api.Snowflake, api.Snowflake], tuple[Query, float, float]] = dc.field(default_factory=dict, init=False, repr=False)
+    lock: threading.Lock = dc.field(default_factory=threading.Lock, init=False, repr=False)
+
+    def get(self, channel_id: api.Snowflake, message_id: api.Snowflake, message: api.Message | None=None):
+        """ Returns the query stored for a message, unless `message` has been
+            changed since, eg. by another process, which makes it out of date. """
+        with self.lock:
+            q, expires, edited = self.queries.get((channel_id, message_id), (None, 0., 0.))
+            if q and (expires < time.monotonic() or (message and edited_at(message) > edited)):
+                del self.queries[channel_id, message_id]
+                return None
+            return q
+
+    def latest(self, channel_id: api.Snowflake):
+        """ Returns the query in the newest message of a channel that has one, and that message's id. """
+        now = time.monotonic()
+        with self.lock:
+            found = [
+                (message_id, q) for (in_channel, message_id), (q, expires, _) in self.queries.items()
+                    if in_channel == channel_id and expires >= now
+            ]
+        if not found: return None
+        message_id, q = max(found, key=lambda item: int(item[0]))
+        return q, message_id
+
+    def put(self, message: api.Message, q: Query):
+        now = time.monotonic()
+        with self.lock:
+            for key in [key for key, (_, expires, _) in self.queries.items() if expires < now]:
+                del self.queries[key]
+            self.queries[message.channel_id, message.id] = q, now + self.ttl, edited_at(message)
+
+    def drop(self, channel_id: api.Snowflake, message_id: api.Snowflake):
+        with self.lock:
+            self.queries.pop((channel_id, message_id), None)
+
+ta_QueryChange = tuple[api.Snowflake, t.Callable[[Query], t.Any]]
+
+@dc.dataclass
+class PendingEdit:
+    changes: list[ta_QueryChange]
+    message: api.Message | None
+    flushing: bool = False
+
+@dc.dataclass
+class QueryEdits:
+    """ Collects the changes made to each query message over a short window,
+        so that a burst of button presses turns into a single edit. """
+    # applies the changes, in order, to the query in a message
+    apply: t.Callable[[api.Snowflake, api.Snowflake, api.Message | None, list[ta_QueryChange]], None]
+    # seconds to wait for more changes after the first one
+    window: float = 0.5
+    pending: dict[tuple[api.Snowflake, api.Snowflake], PendingEdit] = dc.field(default_factory=dict, init=False, repr=False)
+    lock: threading.Lock = dc.field(default_factory=threading.Lock, init=False, repr=False)
+    # notified whenever a flush finishes
+    flushed: threading.Condition = dc.field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.flushed = threading.Condition(self.lock)
+
+    def queue(self, channel_id: api.Snowflake, message_id: api.Snowflake, message: api.Message | None, change: ta_QueryChange):
+        with self.lock:
+            edit = self.pending.get((channel_id, message_id))
+            if edit:
+                edit.changes.append(change)
+                edit.message = message or edit.message
+                return
+            self.pending[channel_id, message_id] = PendingEdit([change], message)
+        self.schedule(channel_id, message_id)
+
+    def schedule(self, channel_id: api.Snowflake, message_id: api.Snowflake):
+        timer = threading.Timer(self.window, self.flush, (channel_id, message_id))
+        timer.daemon = True
+        timer.start()
+
+    def flush(self, channel_id: api.Snowflake, message_id: api.Snowflake, wait: bool=False):
+        """ Applies the changes queued for a message. If they're already being
+            applied, returns right away, or with `wait`, waits for that to
+            finish and then applies whatever was queued in the meantime. """
+        # changes queued while this runs wait for the next flush instead of starting their own
+        with self.lock:
+            edit = self.pending.get((channel_id, message_id))
+            while edit and edit.flushing:
+                if not wait: return
+                self.flushed.wait()
+                edit = self.pending.get((channel_id, message_id))
+            if not edit: return
+            edit.flushing = True
+            changes, edit.changes = edit.changes, []
+        try:
+            self.apply(channel_id, message_id, edit.message, changes)
+        finally:
+            with self.lock:
+                edit.flushing = False
+                more = bool(edit.changes)
+                if not more: del self.pending[channel_id, message_id]
+                self.flushed.notify_all()
+            if more: self.schedule(channel_id, message_id)
+
 @dc.dataclass
 class QueriedPory(pory.Pory):
+    queries: QueryStore = dc.field(default_factory=QueryStore, kw_only=True)
+    # seconds that edits to a query message are held back to be sent together
+    edit_window: float = dc.field(default=0.5, kw_only=True)
+    edits: QueryEdits = dc.field(init=False, repr=False)
+
     def get_latest_query(self, channel_id: api.Snowflake, as_user: api.Snowflake):
-        for message in self.history(channel_id, limit=25):
+        latest = self.queries.latest(channel_id)
+        if latest: return latest
+        for message in self.history(channel_id, limit=25, lazy=True):
             if message.author.id == self.id:
                 print(f"matched IDs")
                 q = Query.from_message(message)
                 if q:
+                    self.queries.put(message, q)
                     return q, message.id
         q = Query([], dt.datetime.now(), {as_user})
         message = self.send(channel_id, req.CreateMessage.Form(**q.collect()))
+        self.queries.put(message, q)
         return q, message.id
 
-    def get_callback_for_component(self, component_id: str):
-        match component_id.split("_", 1):
-            case "add", rest:
-                return self.create_query_callback(Query.add_token, rest)
-            case "next", "dexes":
-                return self.create_query_callback(Query.inc_dex)
-            case "prev", "dexes":
-                return self.create_query_callback(Query.dec_dex)
-            case "rm",:
-                return self.create_query_callback(Query.remove_token)
-        return super().get_callback_for_component(component_id)
+    def __post_init__(self, app_id: str):
+        super().__post_init__(app_id)
+        self.edits = QueryEdits(self.apply_query_changes, self.edit_window)
+
+        self.on_component._options[dexes_next] = self.create_query_callback(Query.inc_dex)
+        self.on_component._options[dexes_prev] = self.create_query_callback(Query.dec_dex)
+        self.on_component._options[rm] = self.create_query_callback(Query.remove_token)
+
+        @self.on_component(name=f"{add}<dexname>")
+        def _(dexname: str, *, channel_id: api.Snowflake, message: api.Message | None, user: api.User):
+            self.update_query(channel_id, message, user, lambda q: q.add_token(dexname))
 
     def create_query_callback(self, do: t.Callable[t.Concatenate[Query, cb.ps_CallbackArgs], cb.t_CommandRet], *args: cb.ps_CallbackArgs.args, **kwargs: cb.ps_CallbackArgs.kwargs):
         def callback(*, channel_id: api.Snowflake, message: api.Message | None, user: api.User):
-            if message:
-                q, message_id = Query.from_message(message), message.id
-                if not q: raise Exception()
-            else:
-                q, message_id = self.get_latest_query(channel_id, user.id)
-            if (q.allowed_users is True) or (user.id in q.allowed_users):
-                do(q, *args, **kwargs)
-                self.edit(channel_id, message_id, req.EditMessage.Form(**q.collect()))
+            self.update_query(channel_id, message, user, lambda q: do(q, *args, **kwargs))
         return cb.Callback("", callback)
 
+    def update_query(self, channel_id: api.Snowflake, message: api.Message | None, user: api.User, do: t.Callable[[Query], t.Any], wait: bool=False):
+        """ Queues a change to a query. Returns before the message is edited, so
+            that button presses are answered with a deferred update right away.
+            With `wait`, the change is applied before returning instead. """
+        if message:
+            message_id = message.id
+        else:
+            _, message_id = self.get_latest_query(channel_id, user.id)
+        self.edits.queue(channel_id, message_id, message, (user.id, do))
+        if wait: self.edits.flush(channel_id, message_id, wait=True)
+
+    def apply_query_changes(self, channel_id: api.Snowflake, message_id: api.Snowflake, message: api.Message | None, changes: list[ta_QueryChange]):
+        q = self.queries.get(channel_id, message_id, message) or (Query.from_message(message) if message else None)
+        if not q: raise Exception()
+        changed = False
+        for user_id, do in changes:
+            if (q.allowed_users is True) or (user_id in q.allowed_users):
+                do(q)
+                changed = True
+        if not changed: return
+        try:
+            edited = self.edit(channel_id, message_id, req.EditMessage.Form(**q.collect()))
+        except Exception:
+            # the message may not show what the stored query now says
+            self.queries.drop(channel_id, message_id)
+            raise
+        self.queries.put(edited, q)
+
 Pory = QueriedPory(
     discordsecrets.DISCORD_CLIENT_ID,
     discordsecrets.DISCORD_PUBLIC_KEY,
-    discordsecrets.DISCORD_USER_TOKEN
+    discordsecrets.DISCORD_USER_TOKEN,
+    # commands only read a few recent messages; separators have their own index
+    cache=cache.MessageCache(max_channels=8, max_messages=100),
 )
 
 @Pory.on_command
-def query(query_input: str="", *, ixn: api.Interaction):
+def query(query_input: str="", *, channel_id: api.Snowflake, user: api.User):
     yield api.ResponseMessage(content="Hold on...", flags=api.MessageFlag.EPHEMERAL)
-    callback = Pory.create_query_callback(Query.add_token, query_input)
-    callback.do(ixn, ixn.data)
+    # applied right away rather than held back with button presses, since
+    # nothing would be left to apply it once this returns
+    Pory.update_query(channel_id, None, user, lambda q: q.add_token(query_input), wait=True)
     return api.ResponseMessage(content="Done.", flags=api.MessageFlag.EPHEMERAL)
 
 @Pory.on_command
@@ -210,27 +374,129 @@ str_break = "<><><><><><><><>"
 str_pause = "(Scene paused)"
 str_unpause = "(Scene unpaused)"
 
+separator_kinds = {
+    "break": str_break,
+    "pause": str_pause,
+    "unpause": str_unpause,
+}
+separators_path = "src/mu2OS/separators.json"
+# how far back to look for separators in a channel that hasn't been indexed yet
+separator_backfill = 3000
+
+@dc.dataclass
+class SeparatorIndex:
+    """ Remembers which messages in each channel are scene separators, so that
+        finding the last one only needs to look at messages posted since the
+        channel was last checked. """
+    path: str
+    # channel id -> the newest message checked, and the kind of each separator up to it by message id
+    channels: dict[str, dict[str, t.Any]] = dc.field(default_factory=dict, init=False)
+    lock: threading.Lock = dc.field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self):
+        if os.path.exists(self.path):
+            with open(self.path, "r") as f:
+                self.channels = json.load(f)
+
+    def save(self):
+        with open(f"{self.path}.tmp", "w") as f:
+            json.dump(self.channels, f, indent=4)
+        os.replace(f"{self.path}.tmp", self.path)
+
+    @staticmethod
+    def kind_of(content: str):
+        for kind, pat in separator_kinds.items():
+            if re.search(pat, content):
+                return kind
+
+    def update(self, bot: pory.Pory, channel_id: api.Snowflake, cancelled: t.Callable[[], bool]=lambda: False):
+        """ Indexes the messages posted since the channel was last checked,
+            backfilling it if it never was. Returns False if cancelled first. """
+        with self.lock:
+            entry = self.channels.get(str(channel_id))
+            checked = int(entry["checked"]) if entry else 0
+        newest: api.Snowflake | None = None
+        found: dict[str, str] = {}
+        reached = False
+        for hist in bot.history(channel_id, limit=separator_backfill, lazy=True):
+            if cancelled(): return False
+            if int(hist.id) <= checked:
+                reached = True
+                break
+            if not newest: newest = hist.id
+            kind = self.kind_of(hist.content)
+            if kind: found[str(hist.id)] = kind
+
+        with self.lock:
+            # another update may have indexed the channel in the meantime
+            entry = self.channels.get(str(channel_id))
+            if entry and int(entry["checked"]) != checked:
+                entry["markers"].update(found)
+                entry["checked"] = str(max(int(entry["checked"]), int(newest or 0)))
+                self.save()
+                return True
+            if not newest and entry: return True
+            # separators before a gap that wasn't checked can't be trusted to be the last ones
+            markers = {**entry["markers"], **found} if entry and reached else found
+            self.channels[str(channel_id)] = {"checked": str(newest or 0), "markers": markers}
+            self.save()
+        return True
+
+    def add(self, channel_id: api.Snowflake, message_id: api.Snowflake, kind: str):
+        with self.lock:
+            entry = self.channels.get(str(channel_id))
+            if not entry: return
+            entry["markers"][str(message_id)] = kind
+            self.save()
+
+    def remove(self, channel_id: api.Snowflake, message_id: api.Snowflake):
+        with self.lock:
+            entry = self.channels.get(str(channel_id))
+            if not entry or entry["markers"].pop(str(message_id), None) is None: return
+            self.save()
+
+    def last(self, channel_id: api.Snowflake, kinds: t.Collection[str]):
+        with self.lock:
+            entry = self.channels.get(str(channel_id))
+            if not entry: return None
+            found = [int(message_id) for message_id, kind in entry["markers"].items() if kind in kinds]
+        return api.Snowflake(str(max(found))) if found else None
+
+separators = SeparatorIndex(separators_path)
+
 @scene(name="break")
 def _(*, id: api.Snowflake, token: str, channel_id: api.Snowflake):
     """ Adds a scene break. """
-    return separator(str_break, (str_break, str_pause, str_unpause), id, token, channel_id)
+    return separator("break", ("break", "pause", "unpause"), id, token, channel_id)
 
 @scene
 def pause(*, id: api.Snowflake, token: str, channel_id: api.Snowflake):
     """ Pauses a scene. The scene can be continued later with `unpause`. """
-    return separator(str_pause, (str_break,), id, token, channel_id)
+    return separator("pause", ("break",), id, token, channel_id)
 
 @scene
 def unpause(*, id: api.Snowflake, token: str, channel_id: api.Snowflake):
     """ Unpauses the most recently paused scene. If used immediately after a pause, deletes that pause. """
-    for hist in Pory.history(channel_id, limit=2) if channel_id else []:
-        if re.search(str_pause, hist.content):
-            Pory.delete(hist.channel_id, hist.id)
-            Pory.delete_response(Pory.id, token)
-            return
-    return separator(str_unpause, (str_pause,), id, token, channel_id)
-
-def separator(content: str, patterns: t.Collection[str], ixn_id: api.Snowflake, token: str, channel_id: api.Snowflake):
+    # fetched rather than read from the cache, which wouldn't know if the
+    # pause was deleted by hand
+    for page in Pory.history_pages(channel_id, limit=2, lazy=True) if channel_id else []:
+        for hist in page:
+            if separators.kind_of(hist.content) == "pause":
+                Pory.delete(hist.channel_id, hist.id)
+                separators.remove(hist.channel_id, hist.id)
+                Pory.delete_response(Pory.id, token)
+                return
+    return separator("unpause", ("pause",), id, token, channel_id)
+
+def message_exists(channel_id: api.Snowflake, message_id: api.Snowflake):
+    try:
+        req.GetChannelMessage(channel_id, message_id).do_raw(Pory.token)
+    except Exception as e:
+        if str(e).startswith("404:"): return False
+        raise
+    return True
+
+def separator(kind: str, kinds: t.Collection[str], ixn_id: api.Snowflake, token: str, channel_id: api.Snowflake):
 
     response, lock = Pory.create_cancel_button(ixn_id, token, "Finding last separator...", "Stop")
 
@@ -238,31 +504,29 @@ def separator(content: str, patterns: t.Collection[str], ixn_id: api.Snowflake,
 
     if not channel_id: return
 
-    last: api.Message | None = None
-
-    limit = 3000
-
-    for hist in Pory.history(channel_id, limit=limit):
-        if lock.is_set():
-            break
-        if any(re.search(pat, hist.content) for pat in patterns):
-            last = hist
-            break
+    last: api.Snowflake | None = None
+    if separators.update(Pory, channel_id, lock.is_set):
+        last = separators.last(channel_id, kinds)
+        # separators deleted by hand stay in the index until they're found missing here
+        while last and not message_exists(channel_id, last):
+            separators.remove(channel_id, last)
+            last = separators.last(channel_id, kinds)
 
     if not last:
-        status = f"Couldn't find a separator in the last {limit} messages" if not lock.is_set() else "Cancelled"
+        status = "Couldn't find a separator" if not lock.is_set() else "Cancelled"
         Pory.send_response(token, req.ExecuteWebhook.Form(
             content=f"{status}. Creating a new separator without a link.",
             flags=api.MessageFlag.EPHEMERAL
         ))
 
-    Pory.send(channel_id, req.CreateMessage.Form(
-        content=content,
+    sent = Pory.send(channel_id, req.CreateMessage.Form(
+        content=separator_kinds[kind],
         message_reference=api.MessageReference(
-            message_id=last.id,
+            message_id=last,
             fail_if_not_exists=False,
         ) if last else None
     ))
+    separators.add(channel_id, sent.id, kind)
 
     if not lock.is_set():
         Pory.delete_response(token)
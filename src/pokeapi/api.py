@@ -8,7 +8,7 @@ from typing import ClassVar, Generic, TypeVar
 from pokeapi.typ import APIType, HasEndpoint, HasName
 
 
-@dataclass
+@dataclass(slots=True)
 class Berry(HasName):
     """ Berries are small fruits that can provide HP and status condition restoration, stat enhancement, and even damage negation when eaten by Pokémon. Check out Bulbapedia for greater detail. """
 
@@ -50,7 +50,7 @@ class Berry(HasName):
     # The type inherited by "Natural Gift" when used with this Berry.
     natural_gift_type: NamedAPIResource[Type]
 
-@dataclass
+@dataclass(slots=True)
 class BerryFlavorMap(APIType):
     # How powerful the referenced flavor is for this berry.
     potency: int
@@ -58,7 +58,7 @@ class BerryFlavorMap(APIType):
     # The referenced berry flavor.
     flavor: NamedAPIResource[BerryFlavor]
 
-@dataclass
+@dataclass(slots=True)
 class BerryFirmness(HasName):
     """ Berries can be soft or hard. Check out Bulbapedia for greater detail. """
 
@@ -76,7 +76,7 @@ class BerryFirmness(HasName):
     # The name of this resource listed in different languages.
     names: list[Name]
 
-@dataclass
+@dataclass(slots=True)
 class BerryFlavor(HasName):
     """ Flavors determine whether a Pokémon will benefit or suffer from eating a berry based on their nature. Check out Bulbapedia for greater detail. """
 
@@ -97,7 +97,7 @@ class BerryFlavor(HasName):
     # The name of this resource listed in different languages.
     names: list[Name]
 
-@dataclass
+@dataclass(slots=True)
 class FlavorBerryMap(APIType):
     # How powerful the referenced flavor is for this berry.
     potency: int
@@ -106,7 +106,7 @@ class FlavorBerryMap(APIType):
     berry: NamedAPIResource[Berry]
 
 
-@dataclass
+@dataclass(slots=True)
 class ContestType(HasName):
     """ Contest types are categories judges used to weigh a Pokémon's condition in Pokémon contests. Check out Bulbapedia for greater detail. """
 
@@ -124,7 +124,7 @@ class ContestType(HasName):
     # The name of this contest type listed in different languages.
     names: list[ContestName]
 
-@dataclass
+@dataclass(slots=True)
 class ContestName(APIType):
     # The name for this contest.
     name: str
@@ -135,7 +135,7 @@ class ContestName(APIType):
     # The language that this name is in.
     language: NamedAPIResource[Language]
 
-@dataclass
+@dataclass(slots=True)
 class ContestEffect(HasEndpoint):
     """ Contest effects refer to the effects of moves when used in contests. """
 
@@ -156,7 +156,7 @@ class ContestEffect(HasEndpoint):
     # The flavor text of this contest effect listed in different languages.
     flavor_text_entries: list[FlavorText]
 
-@dataclass
+@dataclass(slots=True)
 class SuperContestEffect(HasEndpoint):
     """ Super contest effects refer to the effects of moves when used in super contests. """
 
@@ -175,7 +175,7 @@ class SuperContestEffect(HasEndpoint):
     moves: list[NamedAPIResource[Move]]
 
 
-@dataclass
+@dataclass(slots=True)
 class EncounterMethod(HasName):
     """ Methods by which the player might can encounter Pokémon in the wild, e.g., walking in tall grass. Check out Bulbapedia for greater detail. """
 
@@ -193,7 +193,7 @@ class EncounterMethod(HasName):
     # The name of this resource listed in different languages.
     names: list[Name]
 
-@dataclass
+@dataclass(slots=True)
 class EncounterCondition(HasName):
     """ Conditions which affect what pokemon might appear in the wild, e.g., day or night. """
 
@@ -211,7 +211,7 @@ class EncounterCondition(HasName):
     # A list of possible values for this encounter condition.
     values: list[NamedAPIResource[EncounterConditionValue]]
 
-@dataclass
+@dataclass(slots=True)
 class EncounterConditionValue(HasName):
     """ Encounter condition values are the various states that an encounter condition can have, i.e., time of day can be either day or night. """
 
@@ -230,7 +230,7 @@ class EncounterConditionValue(HasName):
     names: list[Name]
 
 
-@dataclass
+@dataclass(slots=True)
 class EvolutionChain(HasEndpoint):
     """ Evolution chains are essentially family trees. They start with the lowest stage within a family and detail evolution conditions for each as well as Pokémon they can evolve into up through the hierarchy. """
 
@@ -245,7 +245,7 @@ class EvolutionChain(HasEndpoint):
     # The base chain link object. Each link contains evolution details for a Pokémon in the chain. Each link references the next Pokémon in the natural evolution order.
     chain: ChainLink
 
-@dataclass
+@dataclass(slots=True)
 class ChainLink(APIType):
     # Whether or not this link is for a baby Pokémon. This would only ever be true on the base link.
     is_baby: bool
@@ -259,7 +259,7 @@ class ChainLink(APIType):
     # A List of chain objects.
     evolves_to: list[ChainLink]
 
-@dataclass
+@dataclass(slots=True)
 class EvolutionDetail(APIType):
     # The item required to cause evolution this into Pokémon species.
     item: NamedAPIResource[Item]
@@ -315,7 +315,7 @@ class EvolutionDetail(APIType):
     # Whether or not the 3DS needs to be turned upside-down as this Pokémon levels up.
     turn_upside_down: bool
 
-@dataclass
+@dataclass(slots=True)
 class EvolutionTrigger(HasName):
     """ Evolution triggers are the events and conditions that cause a Pokémon to evolve. Check out Bulbapedia for greater detail. """
 
@@ -334,7 +334,7 @@ class EvolutionTrigger(HasName):
     pokemon_species: list[NamedAPIResource[PokemonSpecies]]
 
 
-@dataclass
+@dataclass(slots=True)
 class Generation(HasName):
     """ A generation is a grouping of the Pokémon games that separates them based on the Pokémon they include. In each generation, a new set of Pokémon, Moves, Abilities and Types that did not exist in the previous generation are released. """
 
@@ -367,7 +367,7 @@ class Generation(HasName):
     # A list of version groups that were introduced in this generation.
     version_groups: list[NamedAPIResource[VersionGroup]]
 
-@dataclass
+@dataclass(slots=True)
 class Pokedex(HasName):
     """ A Pokédex is a handheld electronic encyclopedia device; one which is capable of recording and retaining information of the various Pokémon in a given region with the exception of the national dex and some smaller dexes related to portions of a region. See Bulbapedia for greater detail. """
 
@@ -397,7 +397,7 @@ class Pokedex(HasName):
     # A list of version groups this Pokédex is relevant to.
     version_groups: list[NamedAPIResource[VersionGroup]]
 
-@dataclass
+@dataclass(slots=True)
 class PokemonEntry(APIType):
     # The index of this Pokémon species entry within the Pokédex.
     entry_number: int
@@ -405,7 +405,7 @@ class PokemonEntry(APIType):
     # The Pokémon species being encountered.
     pokemon_species: NamedAPIResource[PokemonSpecies]
 
-@dataclass
+@dataclass(slots=True)
 class Version(HasName):
     """ Versions of the games, e.g., Red, Blue or Yellow. """
 
@@ -423,7 +423,7 @@ class Version(HasName):
     # The version group this version belongs to.
     version_group: NamedAPIResource[VersionGroup]
 
-@dataclass
+@dataclass(slots=True)
 class VersionGroup(HasName):
     """ Version groups categorize highly similar versions of the games. """
 
@@ -454,7 +454,7 @@ class VersionGroup(HasName):
     versions: list[NamedAPIResource[Version]]
 
 
-@dataclass
+@dataclass(slots=True)
 class Item(HasName):
     """ An item is an object in the games which the player can pick up, keep in their bag, and use in some manner. They have various uses, including healing, powering up, helping catch Pokémon, or to access a new area. """
 
@@ -505,12 +505,12 @@ class Item(HasName):
     # A list of the machines related to this item.
     machines: list[MachineVersionDetail]
 
-@dataclass
+@dataclass(slots=True)
 class ItemSprites(APIType):
     # The default depiction of this item.
     default: str
 
-@dataclass
+@dataclass(slots=True)
 class ItemHolderPokemon(APIType):
     # The Pokémon that holds this item.
     pokemon: NamedAPIResource[Pokemon]
@@ -518,7 +518,7 @@ class ItemHolderPokemon(APIType):
     # The details for the version that this item is held in by the Pokémon.
     version_details: list[ItemHolderPokemonVersionDetail]
 
-@dataclass
+@dataclass(slots=True)
 class ItemHolderPokemonVersionDetail(APIType):
     # How often this Pokémon holds this item in this version.
     rarity: int
@@ -526,7 +526,7 @@ class ItemHolderPokemonVersionDetail(APIType):
     # The version that this item is held in by the Pokémon.
     version: NamedAPIResource[Version]
 
-@dataclass
+@dataclass(slots=True)
 class ItemAttribute(HasName):
     """ Item attributes define particular aspects of items, e.g. "usable in battle" or "consumable". """
 
@@ -547,7 +547,7 @@ class ItemAttribute(HasName):
     # The description of this item attribute listed in different languages.
     descriptions: list[Description]
 
-@dataclass
+@dataclass(slots=True)
 class ItemCategory(HasName):
     """ Item categories determine where items will be placed in the players bag. """
 
@@ -568,7 +568,7 @@ class ItemCategory(HasName):
     # The pocket items in this category would be put in.
     pocket: NamedAPIResource[ItemPocket]
 
-@dataclass
+@dataclass(slots=True)
 class ItemFlingEffect(HasName):
     """ The various effects of the move "Fling" when used with different items. """
 
@@ -586,7 +586,7 @@ class ItemFlingEffect(HasName):
     # A list of items that have this fling effect.
     items: list[NamedAPIResource[Item]]
 
-@dataclass
+@dataclass(slots=True)
 class ItemPocket(HasName):
     """ Pockets within the players bag used for storing items by category. """
 
@@ -605,7 +605,7 @@ class ItemPocket(HasName):
     names: list[Name]
 
 
-@dataclass
+@dataclass(slots=True)
 class Location(HasName):
     """ Locations that can be visited within the games. Locations make up sizable portions of regions, like cities or routes. """
 
@@ -629,7 +629,7 @@ class Location(HasName):
     # Areas that can be found within this location.
     areas: list[NamedAPIResource[LocationArea]]
 
-@dataclass
+@dataclass(slots=True)
 class LocationArea(HasName):
     """ Location areas are sections of areas, such as floors in a building or cave. Each area has its own set of possible Pokémon encounters. """
 
@@ -656,7 +656,7 @@ class LocationArea(HasName):
     # A list of Pokémon that can be encountered in this area along with version specific details about the encounter.
     pokemon_encounters: list[PokemonEncounter]
 
-@dataclass
+@dataclass(slots=True)
 class EncounterMethodRate(APIType):
     # The method in which Pokémon may be encountered in an area..
     encounter_method: NamedAPIResource[EncounterMethod]
@@ -664,7 +664,7 @@ class EncounterMethodRate(APIType):
     # The chance of the encounter to occur on a version of the game.
     version_details: list[EncounterVersionDetails]
 
-@dataclass
+@dataclass(slots=True)
 class EncounterVersionDetails(APIType):
     # The chance of an encounter to occur.
     rate: int
@@ -672,7 +672,7 @@ class EncounterVersionDetails(APIType):
     # The version of the game in which the encounter can occur with the given chance.
     version: NamedAPIResource[Version]
 
-@dataclass
+@dataclass(slots=True)
 class PokemonEncounter(APIType):
     # The Pokémon being encountered.
     pokemon: NamedAPIResource[Pokemon]
@@ -680,7 +680,7 @@ class PokemonEncounter(APIType):
     # A list of versions and encounters with Pokémon that might happen in the referenced location area.
     version_details: list[VersionEncounterDetail]
 
-@dataclass
+@dataclass(slots=True)
 class PalParkArea(HasName):
     """ Areas used for grouping Pokémon encounters in Pal Park. They're like habitats that are specific to Pal Park. """
 
@@ -698,7 +698,7 @@ class PalParkArea(HasName):
     # A list of Pokémon encountered in thi pal park area along with details.
     pokemon_encounters: list[PalParkEncounterSpecies]
 
-@dataclass
+@dataclass(slots=True)
 class PalParkEncounterSpecies(APIType):
     # The base score given to the player when this Pokémon is caught during a pal park run.
     base_score: int
@@ -709,7 +709,7 @@ class PalParkEncounterSpecies(APIType):
     # The Pokémon species being encountered.
     pokemon_species: NamedAPIResource[PokemonSpecies]
 
-@dataclass
+@dataclass(slots=True)
 class Region(HasEndpoint):
     """ A region is an organized area of the Pokémon world. Most often, the main difference between regions is the species of Pokémon that can be encountered within them. """
 
@@ -737,7 +737,7 @@ class Region(HasEndpoint):
     version_groups: list[NamedAPIResource[VersionGroup]]
 
 
-@dataclass
+@dataclass(slots=True)
 class Machine(HasEndpoint):
     """ Machines are the representation of items that teach moves to Pokémon. They vary from version to version, so it is not certain that one specific TM or HM corresponds to a single Machine. """
 
@@ -756,7 +756,7 @@ class Machine(HasEndpoint):
     version_group: NamedAPIResource[VersionGroup]
 
 
-@dataclass
+@dataclass(slots=True)
 class Move(HasName):
     """ Moves are the skills of Pokémon in battle. In battle, a Pokémon uses one move each turn. Some moves can be used outside of battle as well, usually for the purpose of removing obstacles or exploring new areas. """
 
@@ -834,7 +834,7 @@ class Move(HasName):
     # The elemental type of this move.
     type: NamedAPIResource[Type]
 
-@dataclass
+@dataclass(slots=True)
 class ContestComboSets(APIType):
     # A detail of moves this move can be used before or after, granting additional appeal points in contests.
     normal: ContestComboDetail
@@ -842,7 +842,7 @@ class ContestComboSets(APIType):
     # A detail of moves this move can be used before or after, granting additional appeal points in super contests.
     super: ContestComboDetail
 
-@dataclass
+@dataclass(slots=True)
 class ContestComboDetail(APIType):
     # A list of moves to use before this move.
     use_before: list[NamedAPIResource[Move]]
@@ -850,7 +850,7 @@ class ContestComboDetail(APIType):
     # A list of moves to use after this move.
     use_after: list[NamedAPIResource[Move]]
 
-@dataclass
+@dataclass(slots=True)
 class MoveFlavorText(APIType):
     # The localized flavor text for an api resource in a specific language.
     flavor_text: str
@@ -861,7 +861,7 @@ class MoveFlavorText(APIType):
     # The version group that uses this flavor text.
     version_group: NamedAPIResource[VersionGroup]
 
-@dataclass
+@dataclass(slots=True)
 class MoveMetaData(APIType):
     # The status ailment this move inflicts on its target.
     ailment: NamedAPIResource[MoveAilment]
@@ -899,7 +899,7 @@ class MoveMetaData(APIType):
     # The likelihood this attack will cause a stat change in the target Pokémon.
     stat_chance: int
 
-@dataclass
+@dataclass(slots=True)
 class MoveStatChange(APIType):
     # The amount of change.
     change: int
@@ -907,7 +907,7 @@ class MoveStatChange(APIType):
     # The stat being affected.
     stat: NamedAPIResource[Stat]
 
-@dataclass
+@dataclass(slots=True)
 class PastMoveStatValues(APIType):
     # The percent value of how likely this move is to be successful.
     accuracy: int
@@ -930,7 +930,7 @@ class PastMoveStatValues(APIType):
     # The version group in which these move stat values were in effect.
     version_group: NamedAPIResource[VersionGroup]
 
-@dataclass
+@dataclass(slots=True)
 class MoveAilment(HasName):
     """ Move Ailments are status conditions caused by moves used during battle. See Bulbapedia for greater detail. """
 
@@ -948,7 +948,7 @@ class MoveAilment(HasName):
     # The name of this resource listed in different languages.
     names: list[Name]
 
-@dataclass
+@dataclass(slots=True)
 class MoveBattleStyle(HasName):
     """ Styles of moves when used in the Battle Palace. See Bulbapedia for greater detail. """
 
@@ -963,7 +963,7 @@ class MoveBattleStyle(HasName):
     # The name of this resource listed in different languages.
     names: list[Name]
 
-@dataclass
+@dataclass(slots=True)
 class MoveCategory(HasName):
     """ Very general categories that loosely group move effects. """
 
@@ -981,7 +981,7 @@ class MoveCategory(HasName):
     # The description of this resource listed in different languages.
     descriptions: list[Description]
 
-@dataclass
+@dataclass(slots=True)
 class MoveDamageClass(HasName):
     """ Damage classes moves can have, e.g. physical, special, or non-damaging. """
 
@@ -1002,7 +1002,7 @@ class MoveDamageClass(HasName):
     # The name of this resource listed in different languages.
     names: list[Name]
 
-@dataclass
+@dataclass(slots=True)
 class MoveLearnMethod(HasName):
     """ Methods by which Pokémon can learn moves. """
 
@@ -1023,7 +1023,7 @@ class MoveLearnMethod(HasName):
     # A list of version groups where moves can be learned through this method.
     version_groups: list[NamedAPIResource[VersionGroup]]
 
-@dataclass
+@dataclass(slots=True)
 class MoveTarget(HasName):
     """ Targets moves can be directed at during battle. Targets can be Pokémon, environments or even other moves. """
 
@@ -1045,7 +1045,7 @@ class MoveTarget(HasName):
     names: list[Name]
 
 
-@dataclass
+@dataclass(slots=True)
 class Ability(HasName):
     """ Abilities provide passive effects for Pokémon in battle or in the overworld. Pokémon have multiple possible abilities but can have only one ability at a time. Check out Bulbapedia for greater detail. """
 
@@ -1078,7 +1078,7 @@ class Ability(HasName):
     # A list of Pokémon that could potentially have this ability.
     pokemon: list[AbilityPokemon]
 
-@dataclass
+@dataclass(slots=True)
 class AbilityEffectChange(APIType):
     # The previous effect of this ability listed in different languages.
     effect_entries: list[Effect]
@@ -1086,7 +1086,7 @@ class AbilityEffectChange(APIType):
     # The version group in which the previous effect of this ability originated.
     version_group: NamedAPIResource[VersionGroup]
 
-@dataclass
+@dataclass(slots=True)
 class AbilityFlavorText(APIType):
     # The localized name for an API resource in a specific language.
     flavor_text: str
@@ -1097,7 +1097,7 @@ class AbilityFlavorText(APIType):
     # The version group that uses this flavor text.
     version_group: NamedAPIResource[VersionGroup]
 
-@dataclass
+@dataclass(slots=True)
 class AbilityPokemon(APIType):
     # Whether or not this a hidden ability for the referenced Pokémon.
     is_hidden: bool
@@ -1108,7 +1108,7 @@ class AbilityPokemon(APIType):
     # The Pokémon this ability could belong to.
     pokemon: NamedAPIResource[Pokemon]
 
-@dataclass
+@dataclass(slots=True)
 class Characteristic(HasEndpoint):
     """ Characteristics indicate which stat contains a Pokémon's highest IV. A Pokémon's Characteristic is determined by the remainder of its highest IV divided by 5. Check out Bulbapedia for greater detail. """
 
@@ -1123,7 +1123,7 @@ class Characteristic(HasEndpoint):
     # The possible values of the highest stat that would result in a Pokémon recieving this characteristic when divided by 5.
     possible_values: list[int]
 
-@dataclass
+@dataclass(slots=True)
 class EggGroup(HasName):
     """ Egg Groups are categories which determine which Pokémon are able to interbreed. Pokémon may belong to either one or two Egg Groups. Check out Bulbapedia for greater detail. """
 
@@ -1141,7 +1141,7 @@ class EggGroup(HasName):
     # A list of all Pokémon species that are members of this egg group.
     pokemon_species: list[NamedAPIResource[PokemonSpecies]]
 
-@dataclass
+@dataclass(slots=True)
 class Gender(HasName):
     """ Genders were introduced in Generation II for the purposes of breeding Pokémon but can also result in visual differences or even different evolutionary lines. Check out Bulbapedia for greater detail. """
 
@@ -1159,7 +1159,7 @@ class Gender(HasName):
     # A list of Pokémon species that required this gender in order for a Pokémon to evolve into them.
     required_for_evolution: list[NamedAPIResource[PokemonSpecies]]
 
-@dataclass
+@dataclass(slots=True)
 class PokemonSpeciesGender(APIType):
     # The chance of this Pokémon being female, in eighths; or -1 for genderless.
     rate: int
@@ -1167,7 +1167,7 @@ class PokemonSpeciesGender(APIType):
     # A Pokémon species that can be the referenced gender.
     pokemon_species: NamedAPIResource[PokemonSpecies]
 
-@dataclass
+@dataclass(slots=True)
 class GrowthRate(HasName):
     """ Growth rates are the speed with which Pokémon gain levels through experience. Check out Bulbapedia for greater detail. """
 
@@ -1191,7 +1191,7 @@ class GrowthRate(HasName):
     # A list of Pokémon species that gain levels at this growth rate.
     pokemon_species: list[NamedAPIResource[PokemonSpecies]]
 
-@dataclass
+@dataclass(slots=True)
 class GrowthRateExperienceLevel(APIType):
     # The level gained.
     level: int
@@ -1199,7 +1199,7 @@ class GrowthRateExperienceLevel(APIType):
     # The amount of experience required to reach the referenced level.
     experience: int
 
-@dataclass
+@dataclass(slots=True)
 class Nature(HasName):
     """ Natures influence how a Pokémon's stats grow. See Bulbapedia for greater detail. """
 
@@ -1232,7 +1232,7 @@ class Nature(HasName):
     # The name of this resource listed in different languages.
     names: list[Name]
 
-@dataclass
+@dataclass(slots=True)
 class NatureStatChange(APIType):
     # The amount of change.
     max_change: int
@@ -1240,7 +1240,7 @@ class NatureStatChange(APIType):
     # The stat being affected.
     pokeathlon_stat: NamedAPIResource[PokeathlonStat]
 
-@dataclass
+@dataclass(slots=True)
 class MoveBattleStylePreference(APIType):
     # Chance of using the move, in percent, if HP is under one half.
     low_hp_preference: int
@@ -1251,7 +1251,7 @@ class MoveBattleStylePreference(APIType):
     # The move battle style.
     move_battle_style: NamedAPIResource[MoveBattleStyle]
 
-@dataclass
+@dataclass(slots=True)
 class PokeathlonStat(HasName):
     """ Pokeathlon Stats are different attributes of a Pokémon's performance in Pokéathlons. In Pokéathlons, competitions happen on different courses; one for each of the different Pokéathlon stats. See Bulbapedia for greater detail. """
 
@@ -1269,7 +1269,7 @@ class PokeathlonStat(HasName):
     # A detail of natures which affect this Pokéathlon stat positively or negatively.
     affecting_natures: NaturePokeathlonStatAffectSets
 
-@dataclass
+@dataclass(slots=True)
 class NaturePokeathlonStatAffectSets(APIType):
     # A list of natures and how they change the referenced Pokéathlon stat.
     increase: list[NaturePokeathlonStatAffect]
@@ -1277,7 +1277,7 @@ class NaturePokeathlonStatAffectSets(APIType):
     # A list of natures and how they change the referenced Pokéathlon stat.
     decrease: list[NaturePokeathlonStatAffect]
 
-@dataclass
+@dataclass(slots=True)
 class NaturePokeathlonStatAffect(APIType):
     # The maximum amount of change to the referenced Pokéathlon stat.
     max_change: int
@@ -1285,7 +1285,7 @@ class NaturePokeathlonStatAffect(APIType):
     # The nature causing the change.
     nature: NamedAPIResource[Nature]
 
-@dataclass
+@dataclass(slots=True)
 class Pokemon(HasName):
     """ Pokémon are the creatures that inhabit the world of the Pokémon games. They can be caught using Pokéballs and trained by battling with other Pokémon. Each Pokémon belongs to a specific species but may take on a variant which makes it differ from other Pokémon of the same species, such as base stats, available abilities and typings. See Bulbapedia for greater detail. """
 
@@ -1345,7 +1345,7 @@ class Pokemon(HasName):
     # A list of details showing types this Pokémon has.
     types: list[PokemonType]
 
-@dataclass
+@dataclass(slots=True)
 class PokemonAbility(APIType):
     # Whether or not this is a hidden ability.
     is_hidden: bool
@@ -1356,7 +1356,7 @@ class PokemonAbility(APIType):
     # The ability the Pokémon may have.
     ability: NamedAPIResource[Ability]
 
-@dataclass
+@dataclass(slots=True)
 class PokemonType(APIType):
     # The order the Pokémon's types are listed in.
     slot: int
@@ -1364,7 +1364,7 @@ class PokemonType(APIType):
     # The type the referenced Pokémon has.
     type: NamedAPIResource[Type]
 
-@dataclass
+@dataclass(slots=True)
 class PokemonFormType(APIType):
     # The order the Pokémon's types are listed in.
     slot: int
@@ -1372,7 +1372,7 @@ class PokemonFormType(APIType):
     # The type the referenced Form has.
     type: NamedAPIResource[Type]
 
-@dataclass
+@dataclass(slots=True)
 class PokemonTypePast(APIType):
     # The last generation in which the referenced pokémon had the listed types.
     generation: NamedAPIResource[Generation]
@@ -1380,7 +1380,7 @@ class PokemonTypePast(APIType):
     # The types the referenced pokémon had up to and including the listed generation.
     types: list[PokemonType]
 
-@dataclass
+@dataclass(slots=True)
 class PokemonHeldItem(APIType):
     # The item the referenced Pokémon holds.
     item: NamedAPIResource[Item]
@@ -1388,7 +1388,7 @@ class PokemonHeldItem(APIType):
     # The details of the different versions in which the item is held.
     version_details: list[PokemonHeldItemVersion]
 
-@dataclass
+@dataclass(slots=True)
 class PokemonHeldItemVersion(APIType):
     # The version in which the item is held.
     version: NamedAPIResource[Version]
@@ -1396,7 +1396,7 @@ class PokemonHeldItemVersion(APIType):
     # How often the item is held.
     rarity: int
 
-@dataclass
+@dataclass(slots=True)
 class PokemonMove(APIType):
     # The move the Pokémon can learn.
     move: NamedAPIResource[Move]
@@ -1404,7 +1404,7 @@ class PokemonMove(APIType):
     # The details of the version in which the Pokémon can learn the move.
     version_group_details: list[PokemonMoveVersion]
 
-@dataclass
+@dataclass(slots=True)
 class PokemonMoveVersion(APIType):
     # The method by which the move is learned.
     move_learn_method: NamedAPIResource[MoveLearnMethod]
@@ -1415,7 +1415,7 @@ class PokemonMoveVersion(APIType):
     # The minimum level to learn the move.
     level_learned_at: int
 
-@dataclass
+@dataclass(slots=True)
 class PokemonStat(APIType):
     # The stat the Pokémon has.
     stat: NamedAPIResource[Stat]
@@ -1426,7 +1426,7 @@ class PokemonStat(APIType):
     # The base value of the stat.
     base_stat: int
 
-@dataclass
+@dataclass(slots=True)
 class PokemonSprites(APIType):
     # The default depiction of this Pokémon from the front in battle.
     front_default: str
@@ -1452,7 +1452,7 @@ class PokemonSprites(APIType):
     # The shiny female depiction of this Pokémon from the back in battle.
     back_shiny_female: str
 
-@dataclass
+@dataclass(slots=True)
 class LocationAreaEncounter(HasEndpoint):
     """ Pokémon Location Areas are ares where Pokémon can be found. """
 
@@ -1464,7 +1464,7 @@ class LocationAreaEncounter(HasEndpoint):
     # A list of versions and encounters with the referenced Pokémon that might happen.
     version_details: list[VersionEncounterDetail]
 
-@dataclass
+@dataclass(slots=True)
 class PokemonColor(HasName):
     """ Colors used for sorting Pokémon in a Pokédex. The color listed in the Pokédex is usually the color most apparent or covering each Pokémon's body. No orange category exists; Pokémon that are primarily orange are listed as red or brown. """
 
@@ -1482,7 +1482,7 @@ class PokemonColor(HasName):
     # A list of the Pokémon species that have this color.
     pokemon_species: list[NamedAPIResource[PokemonSpecies]]
 
-@dataclass
+@dataclass(slots=True)
 class PokemonForm(HasName):
     """ Some Pokémon may appear in one of multiple, visually different forms. These differences are purely cosmetic. For variations within a Pokémon species, which do differ in more than just visuals, the 'Pokémon' entity is used to represent such a variety. """
 
@@ -1530,7 +1530,7 @@ class PokemonForm(HasName):
     # The form specific form name of this Pokémon form, or empty if the form does not have a specific name.
     form_names: list[Name]
 
-@dataclass
+@dataclass(slots=True)
 class PokemonFormSprites(APIType):
     # The default depiction of this Pokémon form from the front in battle.
     front_default: str
@@ -1544,7 +1544,7 @@ class PokemonFormSprites(APIType):
     # The shiny depiction of this Pokémon form from the back in battle.
     back_shiny: str
 
-@dataclass
+@dataclass(slots=True)
 class PokemonHabitat(HasName):
     """ Habitats are generally different terrain Pokémon can be found in but can also be areas designated for rare or legendary Pokémon. """
 
@@ -1562,7 +1562,7 @@ class PokemonHabitat(HasName):
     # A list of the Pokémon species that can be found in this habitat.
     pokemon_species: list[NamedAPIResource[PokemonSpecies]]
 
-@dataclass
+@dataclass(slots=True)
 class PokemonShape(HasName):
     """ Shapes used for sorting Pokémon in a Pokédex. """
 
@@ -1583,7 +1583,7 @@ class PokemonShape(HasName):
     # A list of the Pokémon species that have this shape.
     pokemon_species: list[NamedAPIResource[PokemonSpecies]]
 
-@dataclass
+@dataclass(slots=True)
 class AwesomeName(APIType):
     # The localized "scientific" name for an API resource in a specific language.
     awesome_name: str
@@ -1591,7 +1591,7 @@ class AwesomeName(APIType):
     # The language this "scientific" name is in.
     language: NamedAPIResource[Language]
 
-@dataclass
+@dataclass(slots=True)
 class PokemonSpecies(HasName):
     """ A Pokémon Species forms the basis for at least one Pokémon. Attributes of a Pokémon species are shared across all varieties of Pokémon within the species. A good example is Wormadam; Wormadam is the species which can be found in three different varieties, Wormadam-Trash, Wormadam-Sandy and Wormadam-Plant. """
 
@@ -1678,7 +1678,7 @@ class PokemonSpecies(HasName):
     # A list of the Pokémon that exist within this Pokémon species.
     varieties: list[PokemonSpeciesVariety]
 
-@dataclass
+@dataclass(slots=True)
 class Genus(APIType):
     # The localized genus for the referenced Pokémon species
     genus: str
@@ -1686,7 +1686,7 @@ class Genus(APIType):
     # The language this genus is in.
     language: NamedAPIResource[Language]
 
-@dataclass
+@dataclass(slots=True)
 class PokemonSpeciesDexEntry(APIType):
     # The index number within the Pokédex.
     entry_number: int
@@ -1694,7 +1694,7 @@ class PokemonSpeciesDexEntry(APIType):
     # The Pokédex the referenced Pokémon species can be found in.
     pokedex: NamedAPIResource[Pokedex]
 
-@dataclass
+@dataclass(slots=True)
 class PalParkEncounterArea(APIType):
     # The base score given to the player when the referenced Pokémon is caught during a pal park run.
     base_score: int
@@ -1705,7 +1705,7 @@ class PalParkEncounterArea(APIType):
     # The pal park area where this encounter happens.
     area: NamedAPIResource[PalParkArea]
 
-@dataclass
+@dataclass(slots=True)
 class PokemonSpeciesVariety(APIType):
     # Whether this variety is the default variety.
     is_default: bool
@@ -1713,7 +1713,7 @@ class PokemonSpeciesVariety(APIType):
     # The Pokémon variety.
     pokemon: NamedAPIResource[Pokemon]
 
-@dataclass
+@dataclass(slots=True)
 class Stat(HasName):
     """ Stats determine certain aspects of battles. Each Pokémon has a value for each stat which grows as they gain levels and can be altered momentarily by effects in battles. """
 
@@ -1746,7 +1746,7 @@ class Stat(HasName):
     # The name of this resource listed in different languages.
     names: list[Name]
 
-@dataclass
+@dataclass(slots=True)
 class MoveStatAffectSets(APIType):
     # A list of moves and how they change the referenced stat.
     increase: list[MoveStatAffect]
@@ -1754,7 +1754,7 @@ class MoveStatAffectSets(APIType):
     # A list of moves and how they change the referenced stat.
     decrease: list[MoveStatAffect]
 
-@dataclass
+@dataclass(slots=True)
 class MoveStatAffect(APIType):
     # The maximum amount of change to the referenced stat.
     change: int
@@ -1762,7 +1762,7 @@ class MoveStatAffect(APIType):
     # The move causing the change.
     move: NamedAPIResource[Move]
 
-@dataclass
+@dataclass(slots=True)
 class NatureStatAffectSets(APIType):
     # A list of natures and how they change the referenced stat.
     increase: list[NamedAPIResource[Nature]]
@@ -1770,7 +1770,7 @@ class NatureStatAffectSets(APIType):
     # A list of nature sand how they change the referenced stat.
     decrease: list[NamedAPIResource[Nature]]
 
-@dataclass
+@dataclass(slots=True)
 class Type(HasName):
     """ Types are properties for Pokémon and their moves. Each type has three properties: which types of Pokémon it is super effective against, which types of Pokémon it is not very effective against, and which types of Pokémon it is completely ineffective against. """
 
@@ -1806,7 +1806,7 @@ class Type(HasName):
     # A list of moves that have this type.
     moves: list[NamedAPIResource[Move]]
 
-@dataclass
+@dataclass(slots=True)
 class TypePokemon(APIType):
     # The order the Pokémon's types are listed in.
     slot: int
@@ -1814,7 +1814,7 @@ class TypePokemon(APIType):
     # The Pokémon that has the referenced type.
     pokemon: NamedAPIResource[Pokemon]
 
-@dataclass
+@dataclass(slots=True)
 class TypeRelations(APIType):
     # A list of types this type has no effect on.
     no_damage_to: list[NamedAPIResource[Type]]
@@ -1834,7 +1834,7 @@ class TypeRelations(APIType):
     # A list of types that are very effective against this type.
     double_damage_from: list[NamedAPIResource[Type]]
 
-@dataclass
+@dataclass(slots=True)
 class TypeRelationsPast(APIType):
     # The last generation in which the referenced type had the listed damage relations
     generation: NamedAPIResource[Generation]
@@ -1843,7 +1843,7 @@ class TypeRelationsPast(APIType):
     damage_relations: TypeRelations
 
 
-@dataclass
+@dataclass(slots=True)
 class Language(HasName):
     """ Languages for translations of API resource information. """
 
@@ -1872,12 +1872,12 @@ class Language(HasName):
 #
 
 t_API = TypeVar("t_API", bound=APIType)
-@dataclass
+@dataclass(slots=True)
 class APIResource(APIType, Generic[t_API]):
     # The URL of the referenced resource.
     url: str
 
-@dataclass
+@dataclass(slots=True)
 class Description(APIType):
     # The localized description for an API resource in a specific language.
     description: str
@@ -1885,7 +1885,7 @@ class Description(APIType):
     # The language this name is in.
     language: NamedAPIResource[Language]
 
-@dataclass
+@dataclass(slots=True)
 class Effect(APIType):
     # The localized effect text for an API resource in a specific language.
     effect: str
@@ -1893,7 +1893,7 @@ class Effect(APIType):
     # The language this effect is in.
     language: NamedAPIResource[Language]
 
-@dataclass
+@dataclass(slots=True)
 class Encounter(APIType):
     # The lowest level the Pokémon could be encountered at.
     min_level: int
@@ -1910,7 +1910,7 @@ class Encounter(APIType):
     # The method by which this encounter happens.
     method: NamedAPIResource[EncounterMethod]
 
-@dataclass
+@dataclass(slots=True)
 class FlavorText(APIType):
     # The localized flavor text for an API resource in a specific language. Note that this text is left unprocessed as it is found in game files. This means that it contains special characters that one might want to replace with their visible decodable version. Please check out this issue to find out more.
     flavor_text: str
@@ -1921,7 +1921,7 @@ class FlavorText(APIType):
     # The game version this flavor text is extracted from.
     version: NamedAPIResource[Version]
 
-@dataclass
+@dataclass(slots=True)
 class GenerationGameIndex(APIType):
     # The internal id of an API resource within game data.
     game_index: int
@@ -1929,7 +1929,7 @@ class GenerationGameIndex(APIType):
     # The generation relevent to this game index.
     generation: NamedAPIResource[Generation]
 
-@dataclass
+@dataclass(slots=True)
 class MachineVersionDetail(APIType):
     # The machine that teaches a move from an item.
     machine: APIResource[Machine]
@@ -1937,7 +1937,7 @@ class MachineVersionDetail(APIType):
     # The version group of this specific machine.
     version_group: NamedAPIResource[VersionGroup]
 
-@dataclass
+@dataclass(slots=True)
 class Name(APIType):
     # The localized name for an API resource in a specific language.
     name: str
@@ -1945,7 +1945,7 @@ class Name(APIType):
     # The language this name is in.
     language: NamedAPIResource[Language]
 
-@dataclass
+@dataclass(slots=True)
 class NamedAPIResource(APIResource[t_API]):
     # The name of the referenced resource.
     name: str
@@ -1953,7 +1953,7 @@ class NamedAPIResource(APIResource[t_API]):
     # The URL of the referenced resource.
     url: str
 
-@dataclass
+@dataclass(slots=True)
 class VerboseEffect(APIType):
     # The localized effect text for an API resource in a specific language.
     effect: str
@@ -1964,7 +1964,7 @@ class VerboseEffect(APIType):
     # The language this effect is in.
     language: NamedAPIResource[Language]
 
-@dataclass
+@dataclass(slots=True)
 class VersionEncounterDetail(APIType):
     # The game version this encounter happens in.
     version: NamedAPIResource[Version]
@@ -1975,7 +1975,7 @@ class VersionEncounterDetail(APIType):
     # A list of encounters and their specifics.
     encounter_details: list[Encounter]
 
-@dataclass
+@dataclass(slots=True)
 class VersionGameIndex(APIType):
     # The internal id of an API resource within game data.
     game_index: int
@@ -1983,7 +1983,7 @@ class VersionGameIndex(APIType):
     # The version relevent to this game index.
     version: NamedAPIResource[Version]
 
-@dataclass
+@dataclass(slots=True)
 class VersionGroupFlavorText(APIType):
     # The localized name for an API resource in a specific language.
     text: str
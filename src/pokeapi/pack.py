@@ -0,0 +1,152 @@
+""" A packed, indexed file format for dexes, so that a lookup reads one record
+    out of a memory map instead of needing the whole dex parsed in memory.
+
+    A packed dex holds a header, a table of names sorted by their UTF-8 bytes,
+    a table of ids sorted by value, then the names and the records themselves,
+    each record as compact JSON. Build them with `python -m pokeapi.pack` from
+    the repository root. """
+
+from __future__ import annotations
+
+import dataclasses as dc
+import json
+import mmap
+import os
+import struct
+import typing as t
+
+MAGIC = b"PDEX"
+VERSION = 1
+
+# magic, version, number of records, number of records with an id
+_header = struct.Struct("<4sIII")
+# name offset, name length, record offset, record length
+_name_entry = struct.Struct("<IIII")
+# id, position of the record in the name table
+_id_entry = struct.Struct("<II")
+
+def build(json_path: str, packed_path: str):
+    """ Converts a dex's JSON file into a packed dex. """
+    with open(json_path, "r") as f:
+        data: dict[str, t.Any] = json.load(f)
+
+    names = sorted(data, key=lambda name: name.encode())
+    encoded_names = [name.encode() for name in names]
+    records = [json.dumps(data[name], separators=(",", ":"), ensure_ascii=False).encode() for name in names]
+    ids = sorted(
+        (data[name]["id"], i) for i, name in enumerate(names)
+            if isinstance(data[name], dict) and isinstance(data[name].get("id"), int)
+    )
+
+    names_at = _header.size + len(names) * _name_entry.size + len(ids) * _id_entry.size
+    records_at = names_at + sum(len(name) for name in encoded_names)
+
+    with open(f"{packed_path}.tmp", "wb") as f:
+        f.write(_header.pack(MAGIC, VERSION, len(names), len(ids)))
+        name_offset, record_offset = names_at, records_at
+        for name, record in zip(encoded_names, records):
+            f.write(_name_entry.pack(name_offset, len(name), record_offset, len(record)))
+            name_offset += len(name)
+            record_offset += len(record)
+        for id_entry in ids:
+            f.write(_id_entry.pack(*id_entry))
+        for name in encoded_names:
+            f.write(name)
+        for record in records:
+            f.write(record)
+    os.replace(f"{packed_path}.tmp", packed_path)
+
+def is_current(json_path: str, packed_path: str):
+    """ Whether a packed dex exists and is no older than its JSON file. """
+    if not os.path.exists(packed_path): return False
+    return not os.path.exists(json_path) or os.path.getmtime(packed_path) >= os.path.getmtime(json_path)
+
+def build_all(directory: str="src/pokeapi/dexes"):
+    """ Packs every dex in a directory that's missing or older than its JSON file. """
+    for filename in sorted(os.listdir(directory)):
+        root, ext = os.path.splitext(filename)
+        if not ext == ".json": continue
+        json_path = os.path.join(directory, filename)
+        packed_path = os.path.join(directory, f"{root}.dex")
+        if is_current(json_path, packed_path): continue
+        print(f"Packing {filename}...")
+        build(json_path, packed_path)
+
+@dc.dataclass
+class DexFile:
+    """ A packed dex, memory-mapped read-only so that every process reading it
+        shares the same pages. """
+
+    buf: mmap.mmap
+    count: int
+    id_count: int
+
+    @classmethod
+    def open(cls, path: str):
+        with open(path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, id_count = _header.unpack_from(buf, 0)
+        if not (magic == MAGIC and version == VERSION):
+            buf.close()
+            raise ValueError(f"'{path}' isn't a packed dex that can be read by this version.")
+        return cls(buf, count, id_count)
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        self.buf.close()
+
+    def entry(self, i: int):
+        return _name_entry.unpack_from(self.buf, _header.size + i * _name_entry.size)
+
+    def name(self, i: int):
+        name_offset, name_length, _, _ = self.entry(i)
+        return self.buf[name_offset:name_offset + name_length].decode()
+
+    def names(self):
+        return [self.name(i) for i in range(self.count)]
+
+    def record(self, i: int) -> t.Any:
+        _, _, record_offset, record_length = self.entry(i)
+        return json.loads(self.buf[record_offset:record_offset + record_length])
+
+    def find(self, name: str):
+        """ Returns the position of the record with this name, or None. """
+        key = name.encode()
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            name_offset, name_length, _, _ = self.entry(mid)
+            found = self.buf[name_offset:name_offset + name_length]
+            if found == key: return mid
+            if found < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def find_id(self, id: int):
+        """ Returns the position of the record with this id, or None. """
+        ids_at = _header.size + self.count * _name_entry.size
+        lo, hi = 0, self.id_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            found, i = _id_entry.unpack_from(self.buf, ids_at + mid * _id_entry.size)
+            if found == id: return i
+            if found < id:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def get(self, name: str) -> t.Any:
+        i = self.find(name)
+        return self.record(i) if i is not None else None
+
+    def get_by_id(self, id: int) -> t.Any:
+        i = self.find_id(id)
+        return self.record(i) if i is not None else None
+
+if __name__ == "__main__":
+    build_all()
@@ -2,7 +2,7 @@
 from dataclasses import dataclass, fields
 from typing import ClassVar, get_type_hints
 
-@dataclass
+@dataclass(slots=True)
 class APIType:
 
     @classmethod
@@ -16,11 +16,11 @@ class APIType:
                 return get_type_hints(cls)[field.name]
         raise KeyError()
 
-@dataclass
+@dataclass(slots=True)
 class HasEndpoint(APIType):
     endpoint: ClassVar[str]
     id: int
 
-@dataclass
+@dataclass(slots=True)
 class HasName(HasEndpoint):
     name: str
\ No newline at end of file
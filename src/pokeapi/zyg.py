@@ -5,13 +5,14 @@ import dataclasses as dc
 import json
 import os
 import re
+import threading
 import typing as t
 from pprint import pprint
 from time import perf_counter
 
 import requests
 
-from pokeapi import api
+from pokeapi import api, pack
 
 t_Getall = t.TypeVar("t_Getall", bound=api.HasEndpoint)
 t_Any = t.TypeVar("t_Any")
@@ -92,18 +93,68 @@ def _binch(call: t.Callable[..., t_Ret], name: str, tab: int) -> t_Ret:
 
 @dc.dataclass
 class Dex(t.Generic[t_Getall]):
+    """ The resources of one type, keyed by name. Its file isn't read until
+        the first lookup, and lookups read single records out of the packed
+        dex when one has been built. """
 
     apitype: type[t_Getall]
-    data: dict[str, t_Getall] = dc.field(init=False)
-
-    def __post_init__(self):
-        with open(f"src/pokeapi/dexes/{self.apitype.__name__}.json", "r") as f:
-            self.data = json.load(f)
+    _data: dict[str, t.Any] | None = dc.field(default=None, init=False, repr=False)
+    _packed: pack.DexFile | None = dc.field(default=None, init=False, repr=False)
+    _opened: bool = dc.field(default=False, init=False, repr=False)
+    _lock: threading.Lock = dc.field(default_factory=threading.Lock, init=False, repr=False)
+
+    @property
+    def path(self):
+        return f"src/pokeapi/dexes/{self.apitype.__name__}.json"
+
+    @property
+    def packed_path(self):
+        return f"src/pokeapi/dexes/{self.apitype.__name__}.dex"
+
+    @property
+    def loaded(self):
+        return self._data is not None or self._packed is not None
+
+    @property
+    def packed(self) -> pack.DexFile | None:
+        if not self._opened:
+            with self._lock:
+                if not self._opened:
+                    if pack.is_current(self.path, self.packed_path):
+                        self._packed = pack.DexFile.open(self.packed_path)
+                    elif os.path.exists(self.packed_path):
+                        print(f"'{self.packed_path}' is older than '{self.path}', so it's being ignored; rebuild it with `python -m pokeapi.pack`.")
+                    self._opened = True
+        return self._packed
+
+    @property
+    def data(self) -> dict[str, t.Any]:
+        if self._data is None:
+            with self._lock:
+                if self._data is None:
+                    self._data = self.load()
+        return self._data
+
+    def load(self) -> dict[str, t.Any]:
+        with open(self.path, "r") as f:
+            return json.load(f)
             # for itemname in self.data:
             #     self.data[itemname] = cast_dataclass(self.data[itemname], self.apitype)
 
+    def get(self, name: str) -> t.Any:
+        packed = self.packed
+        return packed.get(name) if packed else self.data.get(name)
+
+    def get_by_id(self, id: int) -> t.Any:
+        packed = self.packed
+        if packed: return packed.get_by_id(id)
+        return next((item for item in self.data.values() if item.get("id") == id), None)
+
     def search_by_name(self, value: str):
-        return cast(self.data.get(value), self.apitype)
+        return cast(self.get(value), self.apitype)
+
+    def search_by_id(self, value: int):
+        return cast(self.get_by_id(value), self.apitype)
 
 pattern = re.compile(r'(?<!^)(?=[A-Z])')
 
@@ -120,3 +171,14 @@ dexes = collect_subclasses(api.HasName)
 
 def get_dex_for(cls: type[t_Getall]) -> Dex[t_Getall]:
     return dexes[cls.__name__.lower()]
+
+def warm_up(names: t.Iterable[str] | None=None):
+    """ Loads the named dexes, or all of them, on a background thread so
+        that their first lookups don't have to. """
+    def load():
+        for name in names if names is not None else list(dexes):
+            dex = dexes[name]
+            if not dex.packed: dex.data
+    thread = threading.Thread(target=load, name="dex-warm-up", daemon=True)
+    thread.start()
+    return thread